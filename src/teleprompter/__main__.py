@@ -2,18 +2,15 @@
 """Entry point for the teleprompter application."""
 
 import sys
-import warnings
 
+from PyQt6.QtGui import QPixmapCache
 from PyQt6.QtWidgets import QApplication
 
+from .core import config
 from .core.container import configure_container, get_container
 from .utils.logging import setup_logging
 from .ui.app import TeleprompterApp
-
-# Suppress pkg_resources deprecation warning from webrtcvad before any imports
-warnings.filterwarnings(
-    "ignore", message="pkg_resources is deprecated", category=UserWarning
-)
+from .ui.managers.icon_manager import get_icon_manager
 
 
 def main():
@@ -24,6 +21,15 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("CueBird")
 
+    # Rendered icons live in Qt's shared pixmap cache
+    QPixmapCache.setCacheLimit(config.PIXMAP_CACHE_LIMIT_KB)
+
+    # Render toolbar and spinbox icons up front, including the pause icon
+    # that is otherwise first drawn when playback starts
+    icon_manager = get_icon_manager()
+    icon_manager.warmup(("folder-open", "skip-back", "play", "pause"))
+    icon_manager.warmup(("chevron-up", "chevron-down"), size_keys=("small",))
+
     # Configure dependency injection container
     configure_container()
 
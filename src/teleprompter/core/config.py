@@ -62,6 +62,7 @@ NETWORK_TIMEOUT = 5000  # milliseconds
 # Toolbar
 TOOLBAR_HEIGHT = 40
 TOOLBAR_ICON_SIZE = 20
+PIXMAP_CACHE_LIMIT_KB = 20 * 1024  # Qt's shared QPixmapCache budget
 
 # Settings Keys
 SETTINGS_GEOMETRY = "geometry"
@@ -99,6 +99,7 @@ class ConfigurationManager(LoggerMixin):
             # Performance settings
             "enable_animations": True,
             "animation_duration": 200,  # milliseconds
+            "markdown_engine": "python-markdown",
             # Advanced settings
             "log_level": "INFO",
             "log_file": None,
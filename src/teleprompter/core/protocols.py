@@ -46,12 +46,12 @@ class FileLoaderProtocol(Protocol):
         """
         ...
 
-    def get_supported_extensions(self) -> list[str]:
-        """Return list of supported file extensions.
+    def get_supported_extensions(self) -> tuple[str, ...]:
+        """Return the supported file extensions.
 
         Returns:
-            List of file extensions (including the dot) that this loader
-            supports, e.g., ['.md', '.markdown', '.txt'].
+            Tuple of file extensions (including the dot) that this loader
+            supports, e.g., ('.md', '.markdown', '.txt').
         """
         ...
 
@@ -182,6 +182,8 @@ class ContentParserProtocol(Protocol):
     gracefully and provide word count functionality.
     """
 
+    __slots__ = ()
+
     def parse(self, content: str) -> str:
         """Parse content and return formatted output.
 
@@ -409,6 +411,8 @@ class ScrollControllerProtocol(Protocol):
     scrolling, speed control, position tracking, and navigation.
     """
 
+    __slots__ = ()
+
     def start_scrolling(self) -> None:
         """Start scrolling from the current position.
 
@@ -489,6 +493,8 @@ class ReadingMetricsProtocol(Protocol):
     analysis and reading behavior.
     """
 
+    __slots__ = ()
+
     def calculate_reading_time(self, word_count: int, wpm: float) -> float:
         """Calculate estimated reading time in seconds.
 
@@ -71,7 +71,7 @@ class ReadingMetricsService(ReadingMetricsProtocol):
         Initializes timing for the current session and resets pause tracking.
         If a session is already active, this resets the timing.
         """
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._pause_time = None
         self._total_pause_duration = 0.0
 
@@ -82,7 +82,7 @@ class ReadingMetricsService(ReadingMetricsProtocol):
         Safe to call multiple times or when reading is not active.
         """
         if self._start_time and not self._pause_time:
-            self._pause_time = time.time()
+            self._pause_time = time.monotonic()
 
     def resume_reading(self) -> None:
         """Resume reading from pause.
@@ -91,7 +91,7 @@ class ReadingMetricsService(ReadingMetricsProtocol):
         Safe to call when reading is not paused.
         """
         if self._pause_time:
-            self._total_pause_duration += time.time() - self._pause_time
+            self._total_pause_duration += time.monotonic() - self._pause_time
             self._pause_time = None
 
     def stop_reading(self) -> None:
@@ -157,7 +157,7 @@ class ReadingMetricsService(ReadingMetricsProtocol):
         if not self._start_time:
             return 0.0
 
-        current_time = self._pause_time if self._pause_time else time.time()
+        current_time = self._pause_time if self._pause_time else time.monotonic()
         total_time = current_time - self._start_time - self._total_pause_duration
         return max(0.0, total_time)
 
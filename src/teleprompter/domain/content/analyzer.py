@@ -4,6 +4,18 @@ import re
 
 from teleprompter.utils.logging import LoggerMixin
 
+# Patterns used on every content load, compiled once
+_SCRIPT_STYLE_RE = re.compile(
+    r"<(script|style)[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL
+)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_DOCTYPE_RE = re.compile(r"<!DOCTYPE[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_HEADER_TEXT_RE = re.compile(r"<h[1-6][^>]*>(.*?)</h[1-6]>", re.IGNORECASE)
+_HEADER_LEVEL_RE = re.compile(r"<h([1-6])[^>]*>(.*?)</h\1>", re.IGNORECASE)
+_ANCHOR_INVALID_RE = re.compile(r"[^\w\s-]")
+_ANCHOR_SEPARATOR_RE = re.compile(r"[-\s]+")
+
 
 class HtmlContentAnalyzer(LoggerMixin):
     """Analyzer for extracting information from HTML content.
@@ -53,18 +65,13 @@ class HtmlContentAnalyzer(LoggerMixin):
             Plain text with HTML tags removed
         """
         # Remove script and style elements
-        html_clean = re.sub(
-            r"<(script|style)[^>]*>.*?</\1>",
-            "",
-            html_content,
-            flags=re.IGNORECASE | re.DOTALL,
-        )
+        html_clean = _SCRIPT_STYLE_RE.sub("", html_content)
 
         # Remove HTML comments
-        html_clean = re.sub(r"<!--.*?-->", "", html_clean, flags=re.DOTALL)
+        html_clean = _COMMENT_RE.sub("", html_clean)
 
         # Remove DOCTYPE and HTML structure tags
-        html_clean = re.sub(r"<!DOCTYPE[^>]*>", "", html_clean, flags=re.IGNORECASE)
+        html_clean = _DOCTYPE_RE.sub("", html_clean)
 
         # Replace common HTML entities
         html_clean = html_clean.replace("&nbsp;", " ")
@@ -75,10 +82,11 @@ class HtmlContentAnalyzer(LoggerMixin):
         html_clean = html_clean.replace("&#39;", "'")
 
         # Remove HTML tags
-        text_content = re.sub(r"<[^>]+>", " ", html_clean)
+        text_content = _TAG_RE.sub(" ", html_clean)
 
-        # Clean up whitespace
-        text_content = re.sub(r"\s+", " ", text_content).strip()
+        # Clean up whitespace; str.split() uses the same Unicode whitespace
+        # definition as \s and runs without the regex engine
+        text_content = " ".join(text_content.split())
 
         return text_content
 
@@ -92,14 +100,13 @@ class HtmlContentAnalyzer(LoggerMixin):
             List of section titles
         """
         # Find all header tags (h1-h6)
-        header_pattern = r"<h[1-6][^>]*>(.*?)</h[1-6]>"
-        headers = re.findall(header_pattern, html_content, re.IGNORECASE)
+        headers = _HEADER_TEXT_RE.findall(html_content)
 
         # Clean up header text
         sections = []
         for header in headers:
             # Remove any nested HTML tags
-            clean_header = re.sub(r"<[^>]+>", "", header).strip()
+            clean_header = _TAG_RE.sub("", header).strip()
             if clean_header:
                 sections.append(clean_header)
 
@@ -179,15 +186,13 @@ class HtmlContentAnalyzer(LoggerMixin):
         headers = []
 
         # Find all header tags with their level
-        header_pattern = r"<h([1-6])[^>]*>(.*?)</h\1>"
-
-        for match in re.finditer(header_pattern, html_content, re.IGNORECASE):
+        for match in _HEADER_LEVEL_RE.finditer(html_content):
             level = int(match.group(1))
             content = match.group(2)
             position = match.start()
 
             # Clean the header text
-            clean_text = re.sub(r"<[^>]+>", "", content).strip()
+            clean_text = _TAG_RE.sub("", content).strip()
 
             if clean_text:
                 headers.append((level, clean_text, position))
@@ -223,8 +228,8 @@ class HtmlContentAnalyzer(LoggerMixin):
             current_level = level
 
             # Create safe anchor ID
-            anchor_id = re.sub(r"[^\w\s-]", "", title.lower())
-            anchor_id = re.sub(r"[-\s]+", "-", anchor_id)
+            anchor_id = _ANCHOR_INVALID_RE.sub("", title.lower())
+            anchor_id = _ANCHOR_SEPARATOR_RE.sub("-", anchor_id)
 
             toc_html.append(f"<li><a href='#{anchor_id}'>{title}</a></li>")
 
@@ -1,16 +1,61 @@
 """File management for teleprompter content."""
 
 import os
+import stat
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 
+from ...core.exceptions import UnsupportedFileTypeError
 from ...core.protocols import ContentParserProtocol
 from ...utils.logging import LoggerMixin
 from .file_watcher import FileWatcher
 
 
+class _LoadTaskSignals(QObject):
+    """Signals used to hand load results back to the GUI thread."""
+
+    # html_content, file_path, markdown_content, (st_mtime_ns, st_size)
+    loaded = pyqtSignal(str, str, str, object)
+    failed = pyqtSignal(str, object)  # file_path, exception
+
+
+class _LoadTask(QRunnable):
+    """Read and parse a file on a worker thread in a single offload."""
+
+    def __init__(
+        self,
+        file_path: str,
+        load: Callable[[str], tuple[str, str, tuple[int, int]]],
+    ):
+        """Initialize the load task.
+
+        Args:
+            file_path: Path to the file to load
+            load: Callable returning (html_content, markdown_content, fingerprint)
+                for a path
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _LoadTaskSignals()
+        self._load = load
+
+    def run(self) -> None:
+        """Run the load and emit the result or the raised exception."""
+        try:
+            html_content, markdown_content, fingerprint = self._load(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, e)
+        else:
+            self.signals.loaded.emit(
+                html_content, self.file_path, markdown_content, fingerprint
+            )
+
+
 class FileManager(QObject, LoggerMixin):
     """Manages file operations and content loading for the teleprompter.
 
@@ -22,9 +67,18 @@ class FileManager(QObject, LoggerMixin):
     loading_started = pyqtSignal()
     loading_finished = pyqtSignal()
     file_loaded = pyqtSignal(str, str, str)  # html_content, file_path, markdown_content
+    file_reloaded = pyqtSignal(
+        str, str, str
+    )  # html_content, file_path, markdown_content
     error_occurred = pyqtSignal(str, str)  # error_message, error_type
     file_reload_requested = pyqtSignal(str)  # file_path that needs reloading
 
+    # Maximum number of parsed files kept in the parse cache
+    PARSE_CACHE_SIZE = 16
+
+    # Maximum number of concurrent reads when preloading files
+    PRELOAD_CONCURRENCY = 16
+
     def __init__(self, parser: ContentParserProtocol, parent: QObject | None = None):
         """Initialize file manager.
 
@@ -34,8 +88,27 @@ class FileManager(QObject, LoggerMixin):
         """
         super().__init__(parent)
         self._parser = parser
-        self._supported_extensions = [".md", ".markdown", ".txt"]
+        # Immutable, so it can be returned without copying
+        self._supported_extensions = (".md", ".markdown", ".txt")
+        self._supported_extensions_set = frozenset(self._supported_extensions)
         self._current_file_path: str | None = None
+        self._empty_state_html: str | None = None
+
+        # (st_mtime_ns, st_size) of the file as of the last successful load
+        self._last_loaded_fingerprint: tuple[int, int] | None = None
+
+        # LRU cache of (html, markdown) keyed on (file_path, mtime_ns, size)
+        self._parse_cache: OrderedDict[tuple[str, int, int], tuple[str, str]] = (
+            OrderedDict()
+        )
+        self._parse_cache_lock = threading.Lock()
+
+        # Signal emitters of in-flight loads, kept alive until results arrive
+        self._pending_loads: set[_LoadTaskSignals] = set()
+
+        # Dedicated pool so preloading never crowds out interactive loads
+        self._preload_pool = QThreadPool(self)
+        self._preload_pool.setMaxThreadCount(self.PRELOAD_CONCURRENCY)
 
         # Initialize file watcher
         self._file_watcher = FileWatcher(self)
@@ -46,6 +119,9 @@ class FileManager(QObject, LoggerMixin):
     def load_file(self, file_path: str) -> str:
         """Load content from a file.
 
+        The file is opened, fstat'ed, read and closed in one pass with no
+        separate existence or validation checks beforehand.
+
         Args:
             file_path: Path to the file to load
 
@@ -56,19 +132,99 @@ class FileManager(QObject, LoggerMixin):
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is not supported
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
+        return self._read_file_oneshot(file_path)
+
+    def _read_file_oneshot(self, file_path: str) -> str:
+        """Open, fstat, read and close a file in a single pass.
+
+        Args:
+            file_path: Path to the file to read
+
+        Returns:
+            Decoded file content
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is not supported
+        """
+        fd, st = self._open_checked(file_path)
+        try:
+            return self._read_fd(fd, st.st_size)
+        finally:
+            os.close(fd)
+
+    def _open_checked(
+        self, file_path: str, check_extension: bool = True
+    ) -> tuple[int, os.stat_result]:
+        """Open a file for reading and verify it can be loaded.
+
+        Args:
+            file_path: Path to the file to open
+            check_extension: False if the caller already validated the extension
 
-        if not self.validate_file(file_path):
+        Returns:
+            Tuple of (file descriptor, fstat result); caller closes the fd
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If file can't be opened for reading
+            ValueError: If file format is not supported
+        """
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        except IsADirectoryError:
+            raise ValueError(f"Unsupported file format: {file_path}") from None
+        except PermissionError as e:
+            raise PermissionError(e.errno, e.strerror, file_path) from None
+
+        try:
+            st = os.fstat(fd)
+        except OSError:
+            os.close(fd)
+            raise
+
+        supported = (
+            self._is_supported_file(file_path, st)
+            if check_extension
+            else stat.S_ISREG(st.st_mode)
+        )
+        if not supported:
+            os.close(fd)
             raise ValueError(f"Unsupported file format: {file_path}")
 
+        return fd, st
+
+    def _read_fd(self, fd: int, size: int) -> str:
+        """Read a whole file from an open fd and decode it once.
+
+        Args:
+            fd: File descriptor positioned at the start of the file
+            size: Expected file size in bytes, used to size the first read
+
+        Returns:
+            Decoded file content with newlines normalized to LF
+        """
+        # Ask for one extra byte so a single read also detects EOF
+        data = os.read(fd, size + 1)
+        if len(data) > size:
+            # File grew since it was stat'ed; read the remainder
+            chunks = [data]
+            while chunk := os.read(fd, 65536):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+
         try:
-            with open(file_path, encoding="utf-8") as f:
-                return f.read()
+            text = data.decode("utf-8")
         except UnicodeDecodeError:
             # Try with latin-1 encoding as fallback
-            with open(file_path, encoding="latin-1") as f:
-                return f.read()
+            text = data.decode("latin-1")
+
+        # Match text-mode universal newline handling
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
 
     def save_file(self, file_path: str, content: str) -> bool:
         """Save content to a file.
@@ -97,23 +253,44 @@ class FileManager(QObject, LoggerMixin):
         Returns:
             True if file can be loaded, False otherwise
         """
-        if not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except OSError:
             return False
 
-        if not os.path.isfile(file_path):
-            return False
+        return self._is_supported_file(file_path, st)
+
+    def _is_supported_file(self, file_path: str, st: os.stat_result) -> bool:
+        """Check an already-stat'ed path is a regular file with a known extension.
+
+        Args:
+            file_path: Path to the file
+            st: Result of os.stat for the path
+
+        Returns:
+            True if the file can be loaded, False otherwise
+        """
+        return stat.S_ISREG(st.st_mode) and self._has_supported_extension(file_path)
 
-        # Check file extension
-        file_ext = Path(file_path).suffix.lower()
-        return file_ext in self._supported_extensions
+    def _has_supported_extension(self, file_path: str) -> bool:
+        """Check the path's extension without touching the filesystem.
 
-    def get_supported_extensions(self) -> list[str]:
-        """Return list of supported file extensions.
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            True if the extension is supported, False otherwise
+        """
+        file_ext = os.path.splitext(file_path)[1].lower()
+        return file_ext in self._supported_extensions_set
+
+    def get_supported_extensions(self) -> tuple[str, ...]:
+        """Return the supported file extensions.
 
         Returns:
-            List of supported file extensions
+            Tuple of supported file extensions
         """
-        return self._supported_extensions.copy()
+        return self._supported_extensions
 
     def open_file_dialog(self) -> None:
         """Open file dialog for selecting a file to load."""
@@ -129,45 +306,210 @@ class FileManager(QObject, LoggerMixin):
             self._load_file_async(file_path)
 
     def _load_file_async(self, file_path: str) -> None:
-        """Load file asynchronously with progress signals.
+        """Load file on the global thread pool with progress signals.
+
+        Reading and parsing run off the GUI thread; results are delivered
+        back through queued signals.
 
         Args:
             file_path: Path to the file to load
         """
         self.loading_started.emit()
 
+        task = _LoadTask(file_path, self._read_and_parse)
+        task.signals.loaded.connect(self._on_load_task_loaded)
+        task.signals.failed.connect(self._on_load_task_failed)
+        self._pending_loads.add(task.signals)
+        QThreadPool.globalInstance().start(task)
+
+    def reload_file_async(self, file_path: str) -> None:
+        """Re-read and re-parse a changed file off the GUI thread.
+
+        Unlike a regular load this emits file_reloaded rather than
+        file_loaded, and failures are only logged since the previous
+        content stays on screen.
+
+        The reload is skipped when the file's (st_mtime_ns, st_size) still
+        matches the last load, as watchers report spurious change events.
+
+        Args:
+            file_path: Path to the file to reload
+        """
+        if self._is_unchanged_since_load(file_path):
+            self.log_debug(f"File unchanged, skipping reload: {file_path}")
+            return
+
+        task = _LoadTask(file_path, self._read_and_parse)
+        task.signals.loaded.connect(self._on_reload_task_loaded)
+        task.signals.failed.connect(self._on_reload_task_failed)
+        self._pending_loads.add(task.signals)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_reload_task_loaded(
+        self,
+        html_content: str,
+        file_path: str,
+        markdown_content: str,
+        fingerprint: tuple[int, int],
+    ) -> None:
+        """Handle a successful background reload on the GUI thread.
+
+        Args:
+            html_content: Parsed HTML content
+            file_path: Path of the reloaded file
+            markdown_content: Raw file content
+            fingerprint: (st_mtime_ns, st_size) of the file that was read
+        """
+        self._pending_loads.discard(self.sender())
+        if file_path != self._current_file_path:
+            # Another file was opened while this reload was in flight
+            self.log_debug(f"Dropping stale reload result: {file_path}")
+            return
+
+        self._last_loaded_fingerprint = fingerprint
+        self.file_reloaded.emit(html_content, file_path, markdown_content)
+
+    def _on_reload_task_failed(self, file_path: str, error: Exception) -> None:
+        """Log a failed background reload and release its task.
+
+        Args:
+            file_path: Path of the file that failed to reload
+            error: Exception raised while reloading
+        """
+        self._pending_loads.discard(self.sender())
+        self.log_error(f"Failed to reload file {file_path}: {error}")
+
+    def preload_files(self, file_paths: list[str]) -> None:
+        """Read and parse several files concurrently to warm the parse cache.
+
+        Results are only stored in the parse cache; no load signals are
+        emitted, so a later load of any of these files is a cache hit.
+
+        Args:
+            file_paths: Paths of the files to preload
+        """
+        for file_path in file_paths:
+            task = _LoadTask(file_path, self._read_and_parse)
+            task.signals.loaded.connect(self._on_preload_finished)
+            task.signals.failed.connect(self._on_preload_failed)
+            self._pending_loads.add(task.signals)
+            self._preload_pool.start(task)
+
+    def _on_preload_finished(self, *_args) -> None:
+        """Release a completed preload task."""
+        self._pending_loads.discard(self.sender())
+
+    def _on_preload_failed(self, file_path: str, error: Exception) -> None:
+        """Log a failed preload and release its task.
+
+        Args:
+            file_path: Path of the file that failed to preload
+            error: Exception raised while preloading
+        """
+        self._pending_loads.discard(self.sender())
+        self.log_warning(f"Failed to preload {file_path}: {error}")
+
+    def _read_and_parse(self, file_path: str) -> tuple[str, str, tuple[int, int]]:
+        """Read and parse a file, reusing the parse cache when unchanged.
+
+        Runs on a worker thread.
+
+        Args:
+            file_path: Path to the file to load
+
+        Returns:
+            Tuple of (html_content, markdown_content, (st_mtime_ns, st_size))
+        """
+        if not self._has_supported_extension(file_path):
+            raise UnsupportedFileTypeError(file_path, list(self._supported_extensions))
+
         try:
-            # Validate file
-            if not self.validate_file(file_path):
-                self._emit_error(
-                    f"Unsupported file format: {Path(file_path).suffix}",
-                    "File Format Error",
-                )
-                return
+            fd, st = self._open_checked(file_path, check_extension=False)
+        except ValueError:
+            # A directory or other non-regular file with a supported suffix
+            raise UnsupportedFileTypeError(
+                file_path, list(self._supported_extensions)
+            ) from None
+
+        try:
+            # Reuse the parsed result if the file is unchanged on disk
+            fingerprint = (st.st_mtime_ns, st.st_size)
+            cache_key = (file_path, *fingerprint)
+            with self._parse_cache_lock:
+                cached = self._parse_cache.get(cache_key)
+                if cached is not None:
+                    self._parse_cache.move_to_end(cache_key)
+                    return (*cached, fingerprint)
 
             # Load raw content
-            markdown_content = self.load_file(file_path)
+            markdown_content = self._read_fd(fd, st.st_size)
+        finally:
+            os.close(fd)
+
+        # Parse to HTML
+        html_content = self._parser.parse_content(markdown_content)
+
+        with self._parse_cache_lock:
+            self._parse_cache[cache_key] = (html_content, markdown_content)
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+        return html_content, markdown_content, fingerprint
+
+    def _finish_load_task(self) -> None:
+        """Release the completed load task and signal the end of loading."""
+        self._pending_loads.discard(self.sender())
+        self.loading_finished.emit()
 
-            # Parse to HTML
-            html_content = self._parser.parse_content(markdown_content)
+    def _on_load_task_loaded(
+        self,
+        html_content: str,
+        file_path: str,
+        markdown_content: str,
+        fingerprint: tuple[int, int],
+    ) -> None:
+        """Handle a successful background load on the GUI thread.
 
+        Args:
+            html_content: Parsed HTML content
+            file_path: Path of the loaded file
+            markdown_content: Raw file content
+            fingerprint: (st_mtime_ns, st_size) of the file that was read
+        """
+        self._last_loaded_fingerprint = fingerprint
+        try:
             # Emit success signal
             self.file_loaded.emit(html_content, file_path, markdown_content)
 
             # Store current file path and start watching
             self._current_file_path = file_path
             self._file_watcher.watch_file(file_path)
+        finally:
+            self._finish_load_task()
 
-        except FileNotFoundError:
-            self._emit_error(f"File not found: {file_path}", "File Not Found")
-        except ValueError as e:
-            self._emit_error(str(e), "File Processing Error")
-        except Exception as e:
-            self._emit_error(
-                f"Unexpected error loading file: {str(e)}", "Loading Error"
-            )
+    def _on_load_task_failed(self, file_path: str, error: Exception) -> None:
+        """Handle a failed background load on the GUI thread.
+
+        Args:
+            file_path: Path of the file that failed to load
+            error: Exception raised while loading
+        """
+        try:
+            if isinstance(error, UnsupportedFileTypeError):
+                self._emit_error(
+                    f"Unsupported file format: {Path(file_path).suffix}",
+                    "File Format Error",
+                )
+            elif isinstance(error, FileNotFoundError):
+                self._emit_error(f"File not found: {file_path}", "File Not Found")
+            elif isinstance(error, ValueError):
+                self._emit_error(str(error), "File Processing Error")
+            else:
+                self._emit_error(
+                    f"Unexpected error loading file: {str(error)}", "Loading Error"
+                )
         finally:
-            self.loading_finished.emit()
+            self._finish_load_task()
 
     def _emit_error(self, message: str, error_type: str) -> None:
         """Emit error signal and show error dialog.
@@ -192,7 +534,29 @@ class FileManager(QObject, LoggerMixin):
         Returns:
             HTML content for empty state
         """
-        return self._parser._generate_empty_state_html()
+        # The parser is fixed for the session, so render the template once
+        if self._empty_state_html is None:
+            self._empty_state_html = self._parser._generate_empty_state_html()
+        return self._empty_state_html
+
+    def _is_unchanged_since_load(self, file_path: str) -> bool:
+        """Check whether the current file still matches its last load.
+
+        Args:
+            file_path: Path to the file to check
+
+        Returns:
+            True if file_path is the current file and its fingerprint is unchanged
+        """
+        if file_path != self._current_file_path:
+            return False
+
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+
+        return (st.st_mtime_ns, st.st_size) == self._last_loaded_fingerprint
 
     def get_current_file_path(self) -> str | None:
         """Get the path of the currently loaded file.
@@ -208,6 +572,12 @@ class FileManager(QObject, LoggerMixin):
         This is typically called in response to file changes detected by the watcher.
         """
         if self._current_file_path:
+            if self._is_unchanged_since_load(self._current_file_path):
+                self.log_debug(
+                    f"File unchanged, skipping reload: {self._current_file_path}"
+                )
+                return
+
             self.log_info(f"Reloading file: {self._current_file_path}")
             self._load_file_async(self._current_file_path)
 
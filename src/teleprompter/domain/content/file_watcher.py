@@ -1,11 +1,49 @@
 """File watching service for automatic content reloading."""
 
 import os
+import time
 
 from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
 
 from ...utils.logging import LoggerMixin
 
+# Filesystem types on which inotify-style change notifications are unreliable
+_NETWORK_FS_TYPES = frozenset(
+    {"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "afs", "ceph", "fuse.sshfs"}
+)
+
+
+def _is_network_path(file_path: str) -> bool:
+    """Check whether a path lives on a network-mounted filesystem.
+
+    Uses /proc/self/mountinfo, so detection is only available on Linux.
+
+    Args:
+        file_path: Path to check
+
+    Returns:
+        True if the path's mount is a known network filesystem type
+    """
+    real_path = os.path.realpath(file_path)
+    best_mount = ""
+    best_fs_type = ""
+    try:
+        with open("/proc/self/mountinfo", encoding="utf-8") as mountinfo:
+            for line in mountinfo:
+                # Fields: ... mount_point ... - fs_type source options
+                fields, _, tail = line.partition(" - ")
+                mount_point = fields.split(" ")[4].replace("\\040", " ")
+                if len(mount_point) > len(best_mount) and (
+                    real_path == mount_point
+                    or real_path.startswith(mount_point.rstrip("/") + "/")
+                ):
+                    best_mount = mount_point
+                    best_fs_type = tail.split(" ", 1)[0]
+    except (OSError, IndexError):
+        return False
+
+    return best_fs_type in _NETWORK_FS_TYPES
+
 
 class FileWatcher(QObject, LoggerMixin):
     """Monitor files for changes and emit signals when modifications occur.
@@ -39,9 +77,17 @@ class FileWatcher(QObject, LoggerMixin):
         self._debounce_timer.setSingleShot(True)
         self._debounce_timer.timeout.connect(self._emit_file_changed)
         self._debounce_delay = 500  # milliseconds
+        self._debounce_max = 2000  # milliseconds, upper bound on reload latency
 
         # Track if we're waiting to emit
         self._pending_file: str | None = None
+        self._first_event_ts: float | None = None
+
+        # Stat polling fallback for network mounts where notifications don't fire
+        self._poll_timer = QTimer(self)
+        self._poll_timer.timeout.connect(self._poll_stat)
+        self._poll_interval = 2000  # milliseconds
+        self._last_stat: tuple[int, int] | None = None
 
     def watch_file(self, file_path: str) -> bool:
         """Start watching a file for changes.
@@ -65,6 +111,9 @@ class FileWatcher(QObject, LoggerMixin):
         if self._watcher.addPath(file_path):
             self._current_file = file_path
             self.log_info(f"Started watching file: {file_path}")
+
+            if _is_network_path(file_path):
+                self._start_polling(file_path)
             return True
         else:
             self.log_error(f"Failed to watch file: {file_path}")
@@ -78,7 +127,10 @@ class FileWatcher(QObject, LoggerMixin):
             self.log_info(f"Stopped watching file: {self._current_file}")
             self._current_file = None
             self._pending_file = None
+            self._first_event_ts = None
             self._debounce_timer.stop()
+            self._poll_timer.stop()
+            self._last_stat = None
 
     def get_watched_file(self) -> str | None:
         """Get the currently watched file path.
@@ -104,6 +156,14 @@ class FileWatcher(QObject, LoggerMixin):
         """
         self._debounce_delay = max(0, delay_ms)
 
+    def set_debounce_max(self, max_ms: int) -> None:
+        """Set the maximum time a burst of changes can postpone a notification.
+
+        Args:
+            max_ms: Maximum delay in milliseconds
+        """
+        self._debounce_max = max(0, max_ms)
+
     def _on_file_changed(self, file_path: str) -> None:
         """Handle file change notification from QFileSystemWatcher.
 
@@ -125,14 +185,59 @@ class FileWatcher(QObject, LoggerMixin):
             self.log_debug(f"Re-adding file to watcher: {file_path}")
             self._watcher.addPath(file_path)
 
-        # Start or restart debounce timer
+        # Coalesce bursts of events, but never postpone past the max latency
         self._pending_file = file_path
-        self._debounce_timer.stop()
-        self._debounce_timer.start(self._debounce_delay)
-        self.log_debug(f"Started debounce timer for {self._debounce_delay}ms")
+        now = time.monotonic()
+        if self._first_event_ts is None:
+            self._first_event_ts = now
+
+        elapsed_ms = (now - self._first_event_ts) * 1000
+        if elapsed_ms >= self._debounce_max:
+            self._debounce_timer.stop()
+            self._emit_file_changed()
+            return
+
+        delay = int(min(self._debounce_delay, self._debounce_max - elapsed_ms))
+        self._debounce_timer.start(delay)
+        self.log_debug(f"Started debounce timer for {delay}ms")
+
+    def _start_polling(self, file_path: str) -> None:
+        """Start polling the file's stat as a change-notification fallback.
+
+        Args:
+            file_path: Path to the file to poll
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return
+
+        self._last_stat = (st.st_mtime_ns, st.st_size)
+        self._poll_timer.start(self._poll_interval)
+        self.log_info(f"Polling network file every {self._poll_interval}ms")
+
+    def _poll_stat(self) -> None:
+        """Compare the watched file's stat with the last seen value."""
+        file_path = self._current_file
+        if not file_path:
+            self._poll_timer.stop()
+            return
+
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            # Let the regular handler report the removal
+            self._on_file_changed(file_path)
+            return
+
+        current = (st.st_mtime_ns, st.st_size)
+        if current != self._last_stat:
+            self._last_stat = current
+            self._on_file_changed(file_path)
 
     def _emit_file_changed(self) -> None:
         """Emit the file changed signal after debounce delay."""
+        self._first_event_ts = None
         if self._pending_file:
             self.log_info(f"File changed: {self._pending_file}")
             self.file_changed.emit(self._pending_file)
@@ -1,8 +1,17 @@
 """Content management for handling text and markdown operations."""
 
+import bisect
+import re
+import sys
+from collections import OrderedDict
+from operator import itemgetter
+
 from teleprompter.core.protocols import ContentParserProtocol
 from teleprompter.utils.logging import LoggerMixin
 
+# Markdown ATX header: leading '#'s, whitespace, then non-empty header text
+_HEADER_RE = re.compile(r"(?m)^[ \t]*(#{1,6})[ \t]+(\S.*?)[ \t\r]*$")
+
 
 class ContentManager(LoggerMixin):
     """Manager for handling text and markdown content operations.
@@ -11,6 +20,9 @@ class ContentManager(LoggerMixin):
     for the teleprompter application.
     """
 
+    # Maximum number of processed contents kept in the load cache
+    LOAD_CACHE_SIZE = 8
+
     def __init__(self, parser: ContentParserProtocol):
         """Initialize content manager with a parser.
 
@@ -18,10 +30,31 @@ class ContentManager(LoggerMixin):
             parser: Content parser implementation
         """
         self._parser = parser
-        self._current_content: str = ""
+        self._content: str = ""
+        self._lines: list[str] = [""]
+        self._total_lines: int = 1
         self._parsed_content: str = ""
         self._word_count: int = 0
         self._sections: list[tuple[int, str]] = []  # (line_number, header_text)
+        self._section_word_counts: list[int | None] = []  # None until first queried
+        self._section_progress: list[float] = []
+        self._sections_tuple: tuple[tuple[int, str], ...] | None = None
+        self._is_loaded: bool = False
+
+        # LRU cache of processed state (see _snapshot) keyed on content
+        self._load_cache: OrderedDict[str, tuple] = OrderedDict()
+
+    @property
+    def _current_content(self) -> str:
+        """Raw content currently loaded."""
+        return self._content
+
+    @_current_content.setter
+    def _current_content(self, content: str) -> None:
+        """Set the raw content and rebuild the line index."""
+        self._content = content
+        self._lines = content.split("\n")
+        self._total_lines = len(self._lines)
 
     def load_content(self, content: str) -> None:
         """Load and process new content.
@@ -29,15 +62,54 @@ class ContentManager(LoggerMixin):
         Args:
             content: Raw content to load (typically Markdown)
         """
+        if self._is_loaded and content == self._current_content:
+            self.log_debug("Content unchanged, skipping reload")
+            return
+
+        previous_lines = self._lines if self._is_loaded else None
         self._current_content = content
-        self._parsed_content = self._parser.parse(content)
-        self._word_count = self._parser.get_word_count(content)
-        self._extract_sections()
+        self._is_loaded = True
+
+        cached = self._load_cache.get(content)
+        if cached is not None:
+            self._load_cache.move_to_end(content)
+            self._restore_snapshot(cached)
+        else:
+            self._parsed_content = self._parser.parse(content)
+            self._word_count = self._parser.get_word_count(content)
+            if previous_lines is None or not self._update_sections_incrementally(
+                previous_lines
+            ):
+                self._extract_sections()
+
+            self._load_cache[content] = self._snapshot()
+            if len(self._load_cache) > self.LOAD_CACHE_SIZE:
+                self._load_cache.popitem(last=False)
 
         self.log_info(
             f"Content loaded: {self._word_count} words, {len(self._sections)} sections"
         )
 
+    def _snapshot(self) -> tuple:
+        """Capture the derived state of the current content for the load cache."""
+        return (
+            self._parsed_content,
+            self._word_count,
+            self._sections.copy(),
+            self._section_word_counts.copy(),
+            self._section_progress.copy(),
+        )
+
+    def _restore_snapshot(self, snapshot: tuple) -> None:
+        """Restore derived state previously captured by _snapshot."""
+        parsed, word_count, sections, word_counts, progress = snapshot
+        self._parsed_content = parsed
+        self._word_count = word_count
+        self._sections = sections.copy()
+        self._section_word_counts = word_counts.copy()
+        self._section_progress = progress.copy()
+        self._sections_tuple = None
+
     def get_parsed_content(self) -> str:
         """Get the parsed HTML content.
 
@@ -54,33 +126,133 @@ class ContentManager(LoggerMixin):
         """
         return self._word_count
 
-    def get_sections(self) -> list[tuple[int, str]]:
-        """Get list of sections found in the content.
+    def get_sections(self) -> tuple[tuple[int, str], ...]:
+        """Get the sections found in the content.
 
         Returns:
-            List of tuples containing (line_number, header_text)
+            Read-only tuple of (line_number, header_text) tuples
         """
-        return self._sections.copy()
+        if self._sections_tuple is None:
+            self._sections_tuple = tuple(self._sections)
+        return self._sections_tuple
 
     def _extract_sections(self) -> None:
         """Extract section headers from markdown content."""
         self._sections.clear()
-        lines = self._current_content.split("\n")
-
-        for i, line in enumerate(lines):
-            # Check for markdown headers
-            stripped = line.strip()
-            if stripped.startswith("#"):
-                # Extract header level and text
-                header_match = stripped.split(" ", 1)
-                if len(header_match) == 2:
-                    level = len(header_match[0])  # Count # symbols
-                    header_text = header_match[1].strip()
-                    if header_text:
-                        self._sections.append((i, header_text))
-                        self.log_debug(
-                            f"Found section at line {i}: Level {level} - {header_text}"
-                        )
+        content = self._current_content
+
+        # Plain-text scripts have no headers; skip the regex scan entirely
+        if "#" not in content:
+            self._compute_section_stats()
+            return
+
+        # Scan the raw buffer for headers, counting newlines between matches
+        line_number = 0
+        last_pos = 0
+        for match in _HEADER_RE.finditer(content):
+            line_number += content.count("\n", last_pos, match.start())
+            last_pos = match.start()
+
+            level = len(match.group(1))  # Count # symbols
+            # Recurring headers ("Scene", "Act I") share a single string object
+            header_text = sys.intern(match.group(2))
+            self._sections.append((line_number, header_text))
+            self.log_debug(
+                f"Found section at line {line_number}: Level {level} - {header_text}"
+            )
+
+        self._compute_section_stats()
+
+    def _update_sections_incrementally(self, previous_lines: list[str]) -> bool:
+        """Shift existing sections to match an edit that left headers untouched.
+
+        The edit is located by trimming the common prefix and suffix of the
+        old and new line lists. Sections outside the edited range keep their
+        memoized word counts.
+
+        Args:
+            previous_lines: Lines of the previously loaded content
+
+        Returns:
+            True if sections were updated, False if a full re-extract is needed
+        """
+        new_lines = self._lines
+        limit = min(len(previous_lines), len(new_lines))
+
+        prefix = 0
+        while prefix < limit and previous_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+
+        suffix = 0
+        while (
+            suffix < limit - prefix
+            and previous_lines[-1 - suffix] == new_lines[-1 - suffix]
+        ):
+            suffix += 1
+
+        old_end = len(previous_lines) - suffix
+        new_end = len(new_lines) - suffix
+
+        # Any header added, removed or edited requires a full re-extract
+        for line in previous_lines[prefix:old_end] + new_lines[prefix:new_end]:
+            if _HEADER_RE.match(line):
+                return False
+
+        delta = new_end - old_end
+        section_count = len(self._sections)
+        sections = []
+        word_counts: list[int | None] = []
+        for index, (line_number, header_text) in enumerate(self._sections):
+            next_line = (
+                self._sections[index + 1][0]
+                if index + 1 < section_count
+                else len(previous_lines)
+            )
+            touched = line_number <= old_end and next_line >= prefix
+            word_counts.append(None if touched else self._section_word_counts[index])
+            if line_number >= old_end:
+                line_number += delta
+            sections.append((line_number, header_text))
+
+        self._sections = sections
+        self._compute_section_stats()
+        self._section_word_counts = word_counts
+        return True
+
+    def _compute_section_stats(self) -> None:
+        """Precompute progress and reset word counts for extracted sections.
+
+        Word counts need a tokenizing pass per section, so each is computed
+        on first query by _get_section_word_count and then memoized.
+        """
+        self._sections_tuple = None
+        self._section_word_counts = [None] * len(self._sections)
+        self._section_progress = [
+            line_number / self._total_lines if self._total_lines > 0 else 0.0
+            for line_number, _ in self._sections
+        ]
+
+    def _get_section_word_count(self, section_index: int) -> int:
+        """Get the memoized word count for a section.
+
+        Args:
+            section_index: Index of the section
+
+        Returns:
+            Number of words in the section
+        """
+        word_count = self._section_word_counts[section_index]
+        if word_count is None:
+            # Section runs until the next section or end of content
+            line_number = self._sections[section_index][0]
+            end_line = self._total_lines
+            if section_index + 1 < len(self._sections):
+                end_line = self._sections[section_index + 1][0]
+
+            section_content = "\n".join(self._lines[line_number:end_line])
+            word_count = self._parser.get_word_count(section_content)
+            self._section_word_counts[section_index] = word_count
+        return word_count
 
     def find_section_at_progress(self, progress: float) -> int | None:
         """Find section index at given reading progress.
@@ -94,15 +266,11 @@ class ContentManager(LoggerMixin):
         if not self._sections:
             return None
 
-        total_lines = len(self._current_content.split("\n"))
-        current_line = int(progress * total_lines)
+        current_line = int(progress * self._total_lines)
 
-        # Find the last section before current line
-        for i in range(len(self._sections) - 1, -1, -1):
-            if self._sections[i][0] <= current_line:
-                return i
-
-        return 0
+        # Sections are sorted by line, so find the last one at or before current line
+        index = bisect.bisect_right(self._sections, current_line, key=itemgetter(0))
+        return max(0, index - 1)
 
     def get_section_progress(self, section_index: int) -> float:
         """Get progress value for a specific section.
@@ -120,10 +288,9 @@ class ContentManager(LoggerMixin):
         ):
             return 0.0
 
-        total_lines = len(self._current_content.split("\n"))
         section_line = self._sections[section_index][0]
 
-        return section_line / total_lines if total_lines > 0 else 0.0
+        return section_line / self._total_lines if self._total_lines > 0 else 0.0
 
     def get_section_info(self, section_index: int) -> dict | None:
         """Get detailed information about a section.
@@ -143,25 +310,12 @@ class ContentManager(LoggerMixin):
 
         line_number, header_text = self._sections[section_index]
 
-        # Calculate word count for this section
-        lines = self._current_content.split("\n")
-
-        # Find end line (next section or end of content)
-        end_line = len(lines)
-        if section_index + 1 < len(self._sections):
-            end_line = self._sections[section_index + 1][0]
-
-        # Extract section content
-        section_lines = lines[line_number:end_line]
-        section_content = "\n".join(section_lines)
-        section_word_count = self._parser.get_word_count(section_content)
-
         return {
             "index": section_index,
             "title": header_text,
             "line_number": line_number,
-            "word_count": section_word_count,
-            "progress": self.get_section_progress(section_index),
+            "word_count": self._get_section_word_count(section_index),
+            "progress": self._section_progress[section_index],
         }
 
     def get_content_summary(self) -> dict:
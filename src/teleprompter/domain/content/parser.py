@@ -1,13 +1,33 @@
 """Parse markdown files and convert to HTML for display."""
 
 import re
-
-import markdown
+import threading
+from collections import OrderedDict
+from functools import partial
+from importlib.util import find_spec
+from pathlib import Path
 
 from teleprompter.core.configuration import get_config
 from teleprompter.core.protocols import ContentParserProtocol
 from teleprompter.utils.logging import LoggerMixin
 
+# The markdown engines are imported on first parse rather than here: they
+# take tens of milliseconds to import, and the app starts on the empty state
+# without parsing anything.
+CMARKGFM_AVAILABLE = find_spec("cmarkgfm") is not None
+MARKDOWN_IT_AVAILABLE = find_spec("markdown_it") is not None
+MDIT_PLUGINS_AVAILABLE = find_spec("mdit_py_plugins") is not None
+
+# Markdown syntax stripped before counting words. Kept as separate passes:
+# each starts with a literal, which sre scans for far faster than it can
+# try a combined alternation at every position.
+_HEADER_MARKER_RE = re.compile(r"^#+\s+", re.MULTILINE)
+_EMPHASIS_RE = re.compile(r"[*_]{1,3}([^*_]+)[*_]{1,3}")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\([^)]+\)")
+_FENCED_CODE_RE = re.compile(r"```[^`]*```")
+_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+
 
 class LoadingState:
     """Represents different loading states."""
@@ -37,22 +57,165 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
     parsing functionality for the teleprompter application.
     """
 
+    __slots__ = (
+        "config",
+        "_theme",
+        "_md",
+        "_render",
+        "css",
+        "current_state",
+        "last_error",
+        "_doc_prefix",
+        "_doc_suffix",
+        "_error_html_parts",
+        "_loading_html",
+        "_empty_state_html",
+        "_html_cache",
+        "_html_cache_lock",
+        "_word_count_cache",
+    )
+
+    # Maximum number of converted documents kept in the HTML cache
+    HTML_CACHE_SIZE = 32
+
     def __init__(self):
         """Initialize the markdown parser with extensions."""
         self.config = get_config()
-        self.md = markdown.Markdown(extensions=["extra", "nl2br"])
+        self._md = None
+        self._render = None
+        self._theme = self._resolve_theme()
         self.css = self._generate_css()
         self.current_state = LoadingState.IDLE
         self.last_error = None
 
+        # Static HTML around dynamic content, built once from the CSS
+        self._doc_prefix, self._doc_suffix = self._build_document_shell()
+        self._error_html_parts: tuple[str, str, str] | None = None
+        self._loading_html: str | None = None
+        self._empty_state_html: str | None = None
+
+        # LRU cache of full HTML documents keyed on the markdown source.
+        # Documents embed the CSS, which is built once above and never
+        # regenerated, so entries stay valid for the parser's lifetime.
+        # The lock also serializes access to the renderer, which is not
+        # thread-safe and is used from file loading worker threads.
+        self._html_cache: OrderedDict[str, str] = OrderedDict()
+        self._html_cache_lock = threading.Lock()
+
+        # (content, word_count) of the most recent get_word_count call
+        self._word_count_cache: tuple[str, int] | None = None
+
+    @property
+    def md(self):
+        """Python-Markdown instance, created on first use."""
+        if self._md is None:
+            import markdown
+
+            self._md = markdown.Markdown(extensions=["extra", "nl2br"])
+        return self._md
+
+    def _get_renderer(self):
+        """Get the markdown to HTML render function, creating it on first use.
+
+        Returns:
+            Callable converting markdown text to an HTML body
+        """
+        if self._render is None:
+            self._render = self._create_renderer()
+        return self._render
+
+    def _create_renderer(self):
+        """Create the markdown to HTML render function.
+
+        Python-Markdown with the "extra" and "nl2br" extensions is the
+        default. The "markdown_engine" setting can opt into cmarkgfm (C) or
+        markdown-it-py instead, which are faster but don't support the whole
+        "extra" dialect: neither has abbreviations or attribute lists, and
+        cmarkgfm has no definition lists. Footnotes and definition lists are
+        enabled where the engine offers them.
+
+        Returns:
+            Callable converting markdown text to an HTML body
+        """
+        engine = self.config.get("markdown_engine", "python-markdown")
+
+        if engine == "cmarkgfm" and CMARKGFM_AVAILABLE:
+            import cmarkgfm
+            from cmarkgfm.cmark import Options
+
+            # Only the extensions matching "extra"; the full GFM preset
+            # would also autolink bare URLs and filter raw HTML tags
+            return partial(
+                cmarkgfm.markdown_to_html_with_extensions,
+                options=(
+                    Options.CMARK_OPT_UNSAFE
+                    | Options.CMARK_OPT_HARDBREAKS
+                    | Options.CMARK_OPT_FOOTNOTES
+                ),
+                extensions=["table", "strikethrough"],
+            )
+
+        if engine == "markdown-it" and MARKDOWN_IT_AVAILABLE:
+            from markdown_it import MarkdownIt
+
+            md_it = MarkdownIt("commonmark", {"breaks": True, "html": True})
+            md_it.enable(["table", "strikethrough"])
+            if MDIT_PLUGINS_AVAILABLE:
+                from mdit_py_plugins.deflist import deflist_plugin
+                from mdit_py_plugins.footnote import footnote_plugin
+
+                md_it.use(footnote_plugin).use(deflist_plugin)
+            return md_it.render
+
+        if engine != "python-markdown":
+            self.log_warning(
+                f"Markdown engine {engine!r} is not installed, using Python-Markdown"
+            )
+        return self._render_with_python_markdown
+
+    def _render_with_python_markdown(self, markdown_text: str) -> str:
+        """Render markdown with the shared Python-Markdown instance.
+
+        The instance is reused to avoid recompiling extension patterns, but
+        it keeps reference links, footnotes and stashed HTML between
+        conversions, so it's reset before each one.
+
+        Args:
+            markdown_text: Markdown source to convert
+
+        Returns:
+            HTML body content
+        """
+        self.md.reset()
+        return self.md.convert(markdown_text)
+
+    def _resolve_theme(self) -> dict:
+        """Resolve the configuration values used by the HTML templates.
+
+        Looked up once so the CSS and the state pages share the same values.
+
+        Returns:
+            Dictionary of theme values with defaults applied
+        """
+        return {
+            "background_color": self.config.get("BACKGROUND_COLOR", "#000000"),
+            "text_color": self.config.get("TEXT_COLOR", "#FFFFFF"),
+            "font_family": self.config.get("DEFAULT_FONT_FAMILY", "Arial, sans-serif"),
+            "font_size": self.config.get("DEFAULT_FONT_SIZE", 24),
+            "accent_color": self.config.get("ACCENT_COLOR", "#4A90E2"),
+            "primary_colors": self.config.get(
+                "PRIMARY_COLORS", {"500": "#2196f3", "600": "#1e88e5"}
+            ),
+        }
+
     def _generate_css(self) -> str:
         """Generate CSS for teleprompter styling with enhanced typography."""
-        # Get configuration values with defaults
-        bg_color = self.config.get("BACKGROUND_COLOR", "#000000")
-        text_color = self.config.get("TEXT_COLOR", "#FFFFFF")
-        font_family = self.config.get("DEFAULT_FONT_FAMILY", "Arial, sans-serif")
-        font_size = self.config.get("DEFAULT_FONT_SIZE", 24)
-        accent_color = self.config.get("ACCENT_COLOR", "#4A90E2")
+        theme = self._theme
+        bg_color = theme["background_color"]
+        text_color = theme["text_color"]
+        font_family = theme["font_family"]
+        font_size = theme["font_size"]
+        accent_color = theme["accent_color"]
         # max_file_size = self.config.get('MAX_FILE_SIZE', 1048576)  # Unused variable
         # primary_colors = self.config.get('PRIMARY_COLORS', {  # Unused variable
         #     "400": "#42a5f5",
@@ -66,11 +229,17 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
                 box-sizing: border-box;
             }}
 
+            /* Base size as a custom property so it can be changed live
+               without regenerating the document */
+            :root {{
+                --teleprompter-font-size: {font_size}px;
+            }}
+
             body {{
                 background-color: {bg_color};
                 color: {text_color};
                 font-family: {font_family};
-                font-size: {font_size}px;
+                font-size: var(--teleprompter-font-size);
                 font-weight: 400;
                 line-height: 1.6;
                 letter-spacing: 0.01em;
@@ -230,19 +399,20 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
     def parse_file(self, file_path: str) -> str:
         """Parse a markdown file and return HTML content."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+            path = Path(file_path)
 
-            # Check file size
+            # Check the on-disk size so oversized files are never read
             max_size = self.config.get("MAX_FILE_SIZE", 1048576)
-            if len(content.encode("utf-8")) > max_size:
+            if path.stat().st_size > max_size:
                 raise ValueError(f"File size exceeds maximum of {max_size} bytes")
 
-            # Convert markdown to HTML
-            html_content = self.md.convert(content)
+            # Whole-file read without buffered text I/O
+            content = path.read_bytes().decode("utf-8")
+            # Match text-mode universal newline handling
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
 
-            # Generate full HTML document
-            return self._create_html_document(html_content)
+            return self._convert_and_wrap(content)
 
         except Exception as e:
             raise ValueError(f"Error parsing markdown file: {str(e)}") from e
@@ -250,18 +420,46 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
     def parse_content(self, markdown_text: str) -> str:
         """Parse markdown text and return HTML content."""
         try:
-            # Convert markdown to HTML
-            html_content = self.md.convert(markdown_text)
-
-            # Generate full HTML document
-            return self._create_html_document(html_content)
+            return self._convert_and_wrap(markdown_text)
 
         except Exception as e:
             raise ValueError(f"Error parsing markdown content: {str(e)}") from e
 
-    def _create_html_document(self, body_content: str) -> str:
-        """Create a complete HTML document with CSS styling."""
-        return f"""<!DOCTYPE html>
+    # ContentParserProtocol entry point
+    parse = parse_content
+
+    def _convert_and_wrap(self, markdown_text: str) -> str:
+        """Convert markdown to a full HTML document, reusing cached output.
+
+        Args:
+            markdown_text: Markdown source to convert
+
+        Returns:
+            Complete HTML document with CSS styling
+        """
+        with self._html_cache_lock:
+            cached = self._html_cache.get(markdown_text)
+            if cached is not None:
+                self._html_cache.move_to_end(markdown_text)
+                return cached
+
+            html_document = self._create_html_document(
+                self._get_renderer()(markdown_text)
+            )
+
+            self._html_cache[markdown_text] = html_document
+            if len(self._html_cache) > self.HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
+
+        return html_document
+
+    def _build_document_shell(self) -> tuple[str, str]:
+        """Build the static HTML surrounding a parsed document body.
+
+        Returns:
+            Tuple of (prefix, suffix) strings
+        """
+        prefix = f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -270,9 +468,15 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
     {self.css}
 </head>
 <body>
-    {body_content}
+    """
+        suffix = """
 </body>
 </html>"""
+        return prefix, suffix
+
+    def _create_html_document(self, body_content: str) -> str:
+        """Create a complete HTML document with CSS styling."""
+        return self._doc_prefix + body_content + self._doc_suffix
 
     def get_loading_state(self) -> str:
         """Get the current loading state."""
@@ -294,7 +498,18 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
         self, error_message: str, error_type: str = "File Error"
     ) -> str:
         """Generate HTML for error display with retry options."""
-        return f"""<!DOCTYPE html>
+        if self._error_html_parts is None:
+            self._error_html_parts = self._build_error_html_parts()
+        prefix, middle, suffix = self._error_html_parts
+        return prefix + error_type + middle + error_message + suffix
+
+    def _build_error_html_parts(self) -> tuple[str, str, str]:
+        """Build the static HTML surrounding the error type and message.
+
+        Returns:
+            Tuple of (prefix, middle, suffix) strings
+        """
+        prefix = f"""<!DOCTYPE html>
         <html>
         <head>
             <meta charset="utf-8">
@@ -329,7 +544,7 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
 
                 .error-message {{
                     font-size: 16px;
-                    color: {self.config.get("TEXT_COLOR", "#FFFFFF")};
+                    color: {self._theme["text_color"]};
                     margin-bottom: 24px;
                     line-height: 1.5;
                 }}
@@ -357,8 +572,10 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
         <body>
             <div class="error-container">
                 <div class="error-icon">⚠️</div>
-                <div class="error-title">{error_type}</div>
-                <div class="error-message">{error_message}</div>
+                <div class="error-title">"""
+        middle = """</div>
+                <div class="error-message">"""
+        suffix = """</div>
 
                 <div class="error-suggestions">
                     <strong>Try these solutions:</strong>
@@ -372,9 +589,16 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
             </div>
 </body>
 </html>"""
+        return prefix, middle, suffix
 
     def _generate_loading_html(self) -> str:
         """Generate HTML for loading state display."""
+        if self._loading_html is None:
+            self._loading_html = self._build_loading_html()
+        return self._loading_html
+
+    def _build_loading_html(self) -> str:
+        """Build the static loading state HTML."""
         return f"""<!DOCTYPE html>
         <html>
         <head>
@@ -406,7 +630,7 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
 
                 .loading-text {{
                     font-size: 18px;
-                    color: {self.config.get("TEXT_COLOR", "#FFFFFF")};
+                    color: {self._theme["text_color"]};
                     margin-bottom: 8px;
                 }}
 
@@ -427,12 +651,15 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
 
     def _generate_empty_state_html(self) -> str:
         """Generate HTML for empty state display when no file is loaded."""
-        # Get configuration values with defaults
-        text_color = self.config.get("TEXT_COLOR", "#FFFFFF")
-        accent_color = self.config.get("ACCENT_COLOR", "#4A90E2")
-        primary_colors = self.config.get(
-            "PRIMARY_COLORS", {"500": "#2196f3", "600": "#1e88e5"}
-        )
+        if self._empty_state_html is None:
+            self._empty_state_html = self._build_empty_state_html()
+        return self._empty_state_html
+
+    def _build_empty_state_html(self) -> str:
+        """Build the static empty state HTML."""
+        text_color = self._theme["text_color"]
+        accent_color = self._theme["accent_color"]
+        primary_colors = self._theme["primary_colors"]
 
         return f"""<!DOCTYPE html>
         <html>
@@ -597,13 +824,6 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
 </body>
 </html>"""
 
-    def parse(self, content: str) -> str:
-        """Parse markdown content and return HTML.
-
-        This method provides compatibility with ContentParserProtocol.
-        """
-        return self.parse_content(content)
-
     def get_word_count(self, content: str) -> int:
         """Get word count from content.
 
@@ -613,20 +833,33 @@ class MarkdownParser(ContentParserProtocol, LoggerMixin):
         Returns:
             Number of words in the content
         """
-        # Strip markdown syntax for accurate word count
+        # Callers re-count the same script on every progress update
+        cached = self._word_count_cache
+        if cached is not None and cached[0] == content:
+            return cached[1]
+
+        # Strip markdown syntax for accurate word count. Substitutions only
+        # remove characters, so a pass whose marker is absent can be skipped.
+        text = content
 
         # Remove markdown headers
-        text = re.sub(r"^#+\s+", "", content, flags=re.MULTILINE)
+        if "#" in text:
+            text = _HEADER_MARKER_RE.sub("", text)
         # Remove markdown emphasis
-        text = re.sub(r"[*_]{1,3}([^*_]+)[*_]{1,3}", r"\1", text)
-        # Remove markdown links
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-        # Remove markdown images
-        text = re.sub(r"!\[([^\]]*)\]\([^)]+\)", "", text)
+        if "*" in text or "_" in text:
+            text = _EMPHASIS_RE.sub(r"\1", text)
+        if "[" in text:
+            # Remove markdown links
+            text = _LINK_RE.sub(r"\1", text)
+            # Remove markdown images
+            text = _IMAGE_RE.sub("", text)
         # Remove code blocks
-        text = re.sub(r"```[^`]*```", "", text, flags=re.DOTALL)
-        text = re.sub(r"`[^`]+`", "", text)
+        if "`" in text:
+            text = _FENCED_CODE_RE.sub("", text)
+            text = _INLINE_CODE_RE.sub("", text)
 
         # Split by whitespace and count non-empty strings
         words = text.split()
-        return len(words)
+        word_count = len(words)
+        self._word_count_cache = (content, word_count)
+        return word_count
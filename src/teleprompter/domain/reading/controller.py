@@ -1,8 +1,15 @@
 """Scroll controller for managing scrolling behavior and state."""
 
+import numpy as np
+
 from teleprompter.core.protocols import ScrollControllerProtocol
 from teleprompter.utils.logging import LoggerMixin, log_method_calls
 
+# Scroll states. A single int keeps the per-frame checks to one compare.
+_STOPPED = 0
+_RUNNING = 1
+_PAUSED = 2
+
 
 class ScrollController(ScrollControllerProtocol, LoggerMixin):
     """Controller for managing scroll behavior and state.
@@ -11,21 +18,40 @@ class ScrollController(ScrollControllerProtocol, LoggerMixin):
     position tracking, and scroll state management.
     """
 
+    __slots__ = (
+        "_state",
+        "_speed",
+        "_progress",
+        "_viewport_height",
+        "_content_height",
+        "_scroll_position",
+        "_pixels_per_second",
+        "_max_scroll",
+        "_progress_max_scroll",
+    )
+
     # Constants
     MIN_SPEED = 0.05
     MAX_SPEED = 5.0
     BASE_SCROLL_RATE = 100  # pixels per second at speed 1.0
+    # Progress treated as the end, below 1.0 for floating point precision
+    END_PROGRESS = 0.99
 
     def __init__(self):
         """Initialize the scroll controller with default values."""
-        self._is_scrolling: bool = False
-        self._is_paused: bool = False
+        self._state: int = _STOPPED
         self._speed: float = 1.0
         self._progress: float = 0.0
         self._viewport_height: int = 0
         self._content_height: int = 0
         self._scroll_position: int = 0
 
+        # Derived values cached for the per-frame calculate_next_position
+        self._pixels_per_second: float = self.BASE_SCROLL_RATE * self._speed
+        self._max_scroll: int = 0
+        # Scroll range the current _progress was computed against
+        self._progress_max_scroll: int = -1
+
     def set_viewport_dimensions(
         self, viewport_height: int, content_height: int
     ) -> None:
@@ -35,8 +61,20 @@ class ScrollController(ScrollControllerProtocol, LoggerMixin):
             viewport_height: Height of the visible viewport in pixels
             content_height: Total height of the content in pixels
         """
-        self._viewport_height = max(0, viewport_height)
-        self._content_height = max(0, content_height)
+        viewport_height = max(0, viewport_height)
+        content_height = max(0, content_height)
+
+        # Called on every scroll frame; skip the update and log when nothing
+        # changed
+        if (
+            viewport_height == self._viewport_height
+            and content_height == self._content_height
+        ):
+            return
+
+        self._viewport_height = viewport_height
+        self._content_height = content_height
+        self._max_scroll = max(0, self._content_height - self._viewport_height)
         self.log_debug(
             f"Viewport dimensions updated: viewport={viewport_height}px, "
             f"content={content_height}px"
@@ -45,36 +83,36 @@ class ScrollController(ScrollControllerProtocol, LoggerMixin):
     @log_method_calls()
     def start_scrolling(self) -> None:
         """Start scrolling from current position."""
-        self._is_scrolling = True
-        self._is_paused = False
+        self._state = _RUNNING
         self.log_info("Scrolling started")
 
     @log_method_calls()
     def stop_scrolling(self) -> None:
         """Stop scrolling completely and reset position."""
-        self._is_scrolling = False
-        self._is_paused = False
+        self._state = _STOPPED
         self._scroll_position = 0
         self._progress = 0.0
+        self._progress_max_scroll = -1
         self.log_info("Scrolling stopped and reset")
 
     def pause_scrolling(self) -> None:
         """Pause scrolling (can be resumed)."""
-        if self._is_scrolling:
-            self._is_paused = True
+        if self._state == _RUNNING:
+            self._state = _PAUSED
             self.log_debug("Scrolling paused")
 
     def resume_scrolling(self) -> None:
         """Resume scrolling from pause."""
-        if self._is_scrolling and self._is_paused:
-            self._is_paused = False
+        if self._state == _PAUSED:
+            self._state = _RUNNING
             self.log_debug("Scrolling resumed")
 
     def toggle_scrolling(self) -> None:
         """Toggle between play and pause states."""
-        if not self._is_scrolling:
+        state = self._state
+        if state == _STOPPED:
             self.start_scrolling()
-        elif self._is_paused:
+        elif state == _PAUSED:
             self.resume_scrolling()
         else:
             self.pause_scrolling()
@@ -87,6 +125,7 @@ class ScrollController(ScrollControllerProtocol, LoggerMixin):
         """
         old_speed = self._speed
         self._speed = max(self.MIN_SPEED, min(self.MAX_SPEED, speed))
+        self._pixels_per_second = self.BASE_SCROLL_RATE * self._speed
 
         if self._speed != old_speed:
             self.log_debug(f"Speed changed from {old_speed:.2f} to {self._speed:.2f}")
@@ -113,7 +152,7 @@ class ScrollController(ScrollControllerProtocol, LoggerMixin):
         Returns:
             True if actively scrolling, False if stopped or paused
         """
-        return self._is_scrolling and not self._is_paused
+        return self._state == _RUNNING
 
     def is_active(self) -> bool:
         """Check if scrolling is active (may be paused).
@@ -121,7 +160,7 @@ class ScrollController(ScrollControllerProtocol, LoggerMixin):
         Returns:
             True if in scrolling mode (even if paused)
         """
-        return self._is_scrolling
+        return self._state != _STOPPED
 
     def get_progress(self) -> float:
         """Get current progress through the content.
@@ -139,11 +178,11 @@ class ScrollController(ScrollControllerProtocol, LoggerMixin):
         """
         self._progress = max(0.0, min(1.0, position))
 
-        if self._content_height > self._viewport_height:
-            max_scroll = self._content_height - self._viewport_height
-            self._scroll_position = int(self._progress * max_scroll)
+        if self._max_scroll > 0:
+            self._scroll_position = int(self._progress * self._max_scroll)
         else:
             self._scroll_position = 0
+        self._progress_max_scroll = -1
 
         self.log_debug(f"Jumped to position {self._progress:.2%}")
 
@@ -161,11 +200,18 @@ class ScrollController(ScrollControllerProtocol, LoggerMixin):
         Args:
             position: New scroll position in pixels
         """
-        self._scroll_position = max(0, position)
-
-        if self._content_height > self._viewport_height:
-            max_scroll = self._content_height - self._viewport_height
-            self._progress = position / max_scroll if max_scroll > 0 else 0.0
+        pos = position if position > 0 else 0
+        max_scroll = self._max_scroll
+
+        # Fed every frame and by scroll events; progress only changes when
+        # the position or the scrollable range does
+        if pos == self._scroll_position and max_scroll == self._progress_max_scroll:
+            return
+
+        self._scroll_position = pos
+        self._progress_max_scroll = max_scroll
+        if max_scroll > 0:
+            self._progress = pos / max_scroll
         else:
             self._progress = 1.0
 
@@ -178,42 +224,68 @@ class ScrollController(ScrollControllerProtocol, LoggerMixin):
         Returns:
             Next scroll position in pixels
         """
-        if not self.is_scrolling():
+        # Called every frame, so avoid method calls and use cached values
+        if self._state != _RUNNING:
             return self._scroll_position
 
-        # Calculate position change
-        pixels_per_second = self.BASE_SCROLL_RATE * self._speed
-        position_delta = pixels_per_second * delta_time
-        new_position = self._scroll_position + position_delta
+        new_position = self._scroll_position + self._pixels_per_second * delta_time
 
         # Clamp to valid range
-        max_scroll = max(0, self._content_height - self._viewport_height)
-        new_position = max(0, min(max_scroll, new_position))
-
+        if new_position < 0:
+            return 0
+        if new_position > self._max_scroll:
+            return self._max_scroll
         return int(new_position)
 
+    def calculate_positions(self, delta_times: np.ndarray) -> np.ndarray:
+        """Calculate the scroll positions for several upcoming frames at once.
+
+        Vectorized look-ahead for calculate_next_position: element i is the
+        position after the first i + 1 time steps. Positions accumulate
+        without rounding between steps and are clamped to the scrollable
+        range. The controller's state is not changed.
+
+        Args:
+            delta_times: Time elapsed for each successive frame in seconds
+
+        Returns:
+            Array of scroll positions in pixels, one per time step
+        """
+        delta_times = np.asarray(delta_times, dtype=np.float64)
+        if self._state != _RUNNING:
+            return np.full(delta_times.shape, self._scroll_position, dtype=np.int32)
+
+        positions = np.cumsum(delta_times)
+        positions *= self._pixels_per_second
+        positions += self._scroll_position
+        np.clip(positions, 0, self._max_scroll, out=positions)
+        return positions.astype(np.int32)
+
     def has_reached_end(self) -> bool:
         """Check if scrolling has reached the end of content.
 
         Returns:
             True if at the end of content
         """
-        # Use 0.99 to account for floating point precision
-        return self._progress >= 0.99
+        return self._progress >= self.END_PROGRESS
 
     def get_state(self) -> dict:
         """Get the current state of the scroll controller.
 
+        A new snapshot is built per call; callers may keep or modify it.
+
         Returns:
             Dictionary containing controller state
         """
+        progress = self._progress
+        state = self._state
         return {
-            "is_scrolling": self._is_scrolling,
-            "is_paused": self._is_paused,
+            "is_scrolling": state != _STOPPED,
+            "is_paused": state == _PAUSED,
             "speed": self._speed,
-            "progress": self._progress,
+            "progress": progress,
             "scroll_position": self._scroll_position,
             "viewport_height": self._viewport_height,
             "content_height": self._content_height,
-            "has_reached_end": self.has_reached_end(),
+            "has_reached_end": progress >= self.END_PROGRESS,
         }
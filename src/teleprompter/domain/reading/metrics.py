@@ -13,6 +13,15 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
     and provides statistics about the reading session.
     """
 
+    __slots__ = (
+        "_start_time",
+        "_pause_time",
+        "_total_pause_duration",
+        "_word_count",
+        "_current_progress",
+        "_base_wpm",
+    )
+
     def __init__(self, base_wpm: float = 150.0):
         """Initialize the reading metrics service.
 
@@ -48,7 +57,7 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
 
         Resets pause duration and starts timing.
         """
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._pause_time = None
         self._total_pause_duration = 0.0
         self.log_info("Reading session started")
@@ -59,7 +68,7 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
         Records the pause time for duration calculation.
         """
         if self._start_time and not self._pause_time:
-            self._pause_time = time.time()
+            self._pause_time = time.monotonic()
             self.log_debug("Reading paused")
 
     def resume_reading(self) -> None:
@@ -68,7 +77,7 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
         Calculates and adds the pause duration to total pause time.
         """
         if self._pause_time:
-            pause_duration = time.time() - self._pause_time
+            pause_duration = time.monotonic() - self._pause_time
             self._total_pause_duration += pause_duration
             self._pause_time = None
             self.log_debug(f"Reading resumed after {pause_duration:.1f}s pause")
@@ -94,7 +103,7 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
         """
         if word_count <= 0 or wpm <= 0:
             return 0.0
-        return (word_count / wpm) * 60.0
+        return word_count * 60.0 / wpm
 
     def calculate_words_per_minute(self, speed: float) -> float:
         """Calculate effective words per minute based on scroll speed.
@@ -116,7 +125,7 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
         if not self._start_time:
             return 0.0
 
-        current_time = self._pause_time if self._pause_time else time.time()
+        current_time = self._pause_time if self._pause_time else time.monotonic()
         total_time = current_time - self._start_time - self._total_pause_duration
         return max(0.0, total_time)
 
@@ -126,17 +135,27 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
         Returns:
             Estimated remaining time based on current progress and reading speed
         """
+        return self._remaining_time_for(self.get_elapsed_time())
+
+    def _remaining_time_for(self, elapsed: float) -> float:
+        """Estimate the remaining reading time for a given elapsed time.
+
+        Args:
+            elapsed: Elapsed reading time in seconds
+
+        Returns:
+            Estimated remaining time in seconds
+        """
         if self._word_count <= 0 or self._current_progress >= 1.0:
             return 0.0
 
         words_read = int(self._word_count * self._current_progress)
         words_remaining = self._word_count - words_read
 
-        # Calculate average reading speed based on elapsed time
-        elapsed = self.get_elapsed_time()
+        # Extrapolate from the reading speed so far. Going through words per
+        # minute would scale by 60 and back, so divide once instead.
         if elapsed > 0 and words_read > 0:
-            actual_wpm = (words_read / elapsed) * 60.0
-            return self.calculate_reading_time(words_remaining, actual_wpm)
+            return words_remaining * elapsed / words_read
         else:
             # Use default WPM if no reading history
             return self.calculate_reading_time(words_remaining, self._base_wpm)
@@ -147,12 +166,22 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
         Returns:
             Average WPM based on actual reading progress
         """
-        elapsed = self.get_elapsed_time()
+        return self._average_wpm_for(self.get_elapsed_time())
+
+    def _average_wpm_for(self, elapsed: float) -> float:
+        """Calculate the average words per minute for a given elapsed time.
+
+        Args:
+            elapsed: Elapsed reading time in seconds
+
+        Returns:
+            Average WPM based on actual reading progress
+        """
         if elapsed <= 0 or self._word_count <= 0:
             return 0.0
 
         words_read = int(self._word_count * self._current_progress)
-        return (words_read / elapsed) * 60.0 if words_read > 0 else 0.0
+        return words_read * 60.0 / elapsed if words_read > 0 else 0.0
 
     def format_time(self, seconds: float) -> str:
         """Format seconds into a human-readable time string.
@@ -163,16 +192,16 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
         Returns:
             Formatted time string (e.g., "2m 30s", "1h 15m")
         """
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            minutes = int(seconds / 60)
-            secs = int(seconds % 60)
-            return f"{minutes}m {secs}s" if secs > 0 else f"{minutes}m"
-        else:
-            hours = int(seconds / 3600)
-            minutes = int((seconds % 3600) / 60)
-            return f"{hours}h {minutes}m"
+        total = int(seconds)
+        if total < 60:
+            return f"{total}s"
+
+        minutes, secs = divmod(total, 60)
+        if minutes < 60:
+            return f"{minutes}m {secs}s" if secs else f"{minutes}m"
+
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}h {minutes}m"
 
     def get_statistics(self) -> dict:
         """Get comprehensive reading statistics.
@@ -180,7 +209,10 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
         Returns:
             Dictionary containing various reading metrics
         """
+        # Read the clock once so every derived value uses the same elapsed
+        # time
         elapsed = self.get_elapsed_time()
+        remaining = self._remaining_time_for(elapsed)
         words_read = int(self._word_count * self._current_progress)
 
         return {
@@ -190,9 +222,9 @@ class ReadingMetricsService(ReadingMetricsProtocol, LoggerMixin):
             "progress_percentage": self._current_progress * 100,
             "elapsed_time": elapsed,
             "elapsed_time_formatted": self.format_time(elapsed),
-            "remaining_time": self.get_remaining_time(),
-            "remaining_time_formatted": self.format_time(self.get_remaining_time()),
-            "average_wpm": self.get_average_wpm(),
+            "remaining_time": remaining,
+            "remaining_time_formatted": self.format_time(remaining),
+            "average_wpm": self._average_wpm_for(elapsed),
             "is_paused": self._pause_time is not None,
             "total_pause_duration": self._total_pause_duration,
         }
@@ -1,14 +1,21 @@
 """Voice activity detection for teleprompter control."""
 
+import contextlib
 import threading
 import time
+import warnings
 
 import numpy as np
 import sounddevice as sd
 from PyQt6.QtCore import QObject, pyqtSignal
 
 try:
-    import webrtcvad
+    # webrtcvad imports pkg_resources, which warns that it is deprecated
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore", message="pkg_resources is deprecated", category=UserWarning
+        )
+        import webrtcvad
 
     WEBRTC_AVAILABLE = True
 except ImportError:
@@ -33,6 +40,13 @@ class VoiceActivityDetector(QObject):
         pyqtSignal()
     )  # Emitted when microphone is successfully initialized
 
+    # Frames of audio kept before the oldest samples are dropped
+    RING_FRAMES = 32
+    # Longest wait for audio before re-checking the running flag (seconds)
+    BUFFER_WAIT_TIMEOUT = 0.1
+    # How long a queried input device list is reused (seconds)
+    DEVICE_CACHE_TTL = 5.0
+
     def __init__(self, parent=None):
         """Initialize the voice activity detector."""
         super().__init__(parent)
@@ -65,7 +79,7 @@ class VoiceActivityDetector(QObject):
         self.set_sensitivity(self.sensitivity)  # Apply initial sensitivity settings
 
         # State tracking (thread-safe access required)
-        self._state_lock = threading.RLock()
+        self._state_lock = threading.Lock()
         self._is_running = False
         self._is_speaking = False
         self._is_speech_detected = False  # Current speech detection state
@@ -77,9 +91,22 @@ class VoiceActivityDetector(QObject):
         self.audio_thread: threading.Thread | None = None
         self.audio_stream: sd.InputStream | None = None
 
-        # Audio buffer with thread-safe access
+        # Fixed-size ring buffer of incoming samples. The condition wakes the
+        # processing thread as soon as a full frame is available.
         self._buffer_lock = threading.Lock()
-        self._audio_buffer = np.array([], dtype=np.float32)
+        self._buffer_ready = threading.Condition(self._buffer_lock)
+        self._ring = np.zeros(self.frame_size * self.RING_FRAMES, dtype=np.float32)
+        self._ring_read = 0
+        self._ring_count = 0
+
+        # Reused frame handed from the ring buffer to processing
+        self._frame_buffer = np.empty(self.frame_size, dtype=np.float32)
+
+        # Reused int16 frame handed to WebRTC VAD
+        self._pcm_buffer = np.empty(self.frame_size, dtype=np.int16)
+
+        # Input devices from the last PortAudio query: (monotonic time, list)
+        self._devices_cache: tuple[float, list[dict]] | None = None
 
         # Signal emission queue for thread safety
         self._signal_lock = threading.Lock()
@@ -158,26 +185,36 @@ class VoiceActivityDetector(QObject):
         with self._state_lock:
             self._last_silence_time = value
 
-    def _emit_signal_safely(self, signal_name: str, *args):
+    def _emit_signal_safely(self, signal, *args):
         """Emit a signal safely from any thread.
 
-        This ensures signals are emitted from the main thread to avoid
-        Qt threading issues.
+        Signals are skipped once detection has stopped. Use _emit_error for
+        error_occurred, which is emitted regardless.
+
+        Args:
+            signal: Bound signal to emit
+            *args: Signal arguments
         """
         # For simplicity, we'll emit directly since PyQt6 handles cross-thread signals
         # In a more complex scenario, you might queue signals for the main thread
         try:
             # Check if we're still running to avoid emitting after cleanup
-            if not self.is_running and signal_name != "error_occurred":
-                return
-
-            signal = getattr(self, signal_name, None)
-            if signal:
+            if self.is_running:
                 signal.emit(*args)
         except RuntimeError:
             # Object has been deleted, ignore the signal
             pass
 
+    def _emit_error(self, message: str):
+        """Emit error_occurred from any thread, even when not running.
+
+        Args:
+            message: Error message
+        """
+        # A deleted object raises RuntimeError; ignore the signal then
+        with contextlib.suppress(RuntimeError):
+            self.error_occurred.emit(message)
+
     def set_sensitivity(self, sensitivity: float):
         """Set VAD sensitivity (0.0-3.0, higher = more sensitive)."""
         if 0.0 <= sensitivity <= 3.0:
@@ -215,7 +252,7 @@ class VoiceActivityDetector(QObject):
             self.is_running = True
             self.is_speaking = False
             self.last_voice_time = 0
-            self.last_silence_time = time.time()
+            self.last_silence_time = time.monotonic()
 
             # Start audio stream
             self.audio_stream = sd.InputStream(
@@ -228,7 +265,7 @@ class VoiceActivityDetector(QObject):
             self.audio_stream.start()
 
             # Emit signal to indicate microphone is ready
-            self._emit_signal_safely("microphone_ready")
+            self._emit_signal_safely(self.microphone_ready)
 
             # Start processing thread
             self.audio_thread = threading.Thread(
@@ -237,9 +274,7 @@ class VoiceActivityDetector(QObject):
             self.audio_thread.start()
 
         except Exception as e:
-            self._emit_signal_safely(
-                "error_occurred", f"Failed to start voice detection: {str(e)}"
-            )
+            self._emit_error(f"Failed to start voice detection: {str(e)}")
             self.stop_detection()
 
     def stop_detection(self):
@@ -256,9 +291,9 @@ class VoiceActivityDetector(QObject):
                 pass  # Ignore errors during cleanup
             self.audio_stream = None
 
-        # Clear audio buffer to unblock processing thread
-        with self._buffer_lock:
-            self._audio_buffer = np.array([], dtype=np.float32)
+        # Clear audio buffer and wake the processing thread so it can exit.
+        # The stream is already stopped, so nothing refills it afterwards.
+        self._clear_audio_buffer()
 
         # Wait for thread to finish with a longer timeout
         if self.audio_thread and self.audio_thread.is_alive():
@@ -280,13 +315,16 @@ class VoiceActivityDetector(QObject):
 
         # Emit final signals if needed
         if was_speaking:
-            self._emit_signal_safely("voice_stopped")
+            self._emit_signal_safely(self.voice_stopped)
         if was_speech_detected:
-            self._emit_signal_safely("speech_detected", False)
+            self._emit_signal_safely(self.speech_detected, False)
 
-        # Clear audio buffer
-        with self._buffer_lock:
-            self._audio_buffer = np.array([], dtype=np.float32)
+    def _clear_audio_buffer(self):
+        """Drop buffered audio and wake any thread waiting for a frame."""
+        with self._buffer_ready:
+            self._ring_read = 0
+            self._ring_count = 0
+            self._buffer_ready.notify_all()
 
     def _audio_callback(self, indata, frames, time_info, status):
         """Callback for audio input stream."""
@@ -295,83 +333,171 @@ class VoiceActivityDetector(QObject):
 
         # Add audio data to buffer (thread-safe)
         audio_data = indata[:, 0]  # Get mono channel
-        with self._buffer_lock:
-            self._audio_buffer = np.append(self._audio_buffer, audio_data)
+        ring = self._ring
+        capacity = len(ring)
+        if len(audio_data) > capacity:
+            audio_data = audio_data[-capacity:]
+        count = len(audio_data)
+
+        with self._buffer_ready:
+            # When processing falls behind, drop the oldest samples
+            overflow = self._ring_count + count - capacity
+            if overflow > 0:
+                self._ring_read = (self._ring_read + overflow) % capacity
+                self._ring_count -= overflow
+
+            write = (self._ring_read + self._ring_count) % capacity
+            first = min(count, capacity - write)
+            ring[write : write + first] = audio_data[:first]
+            ring[: count - first] = audio_data[first:]
+            self._ring_count += count
+
+            if self._ring_count >= self.frame_size:
+                self._buffer_ready.notify()
+
+    def _read_frame(self) -> bool:
+        """Move the next frame from the ring buffer into the frame buffer.
+
+        Waits briefly for enough audio to arrive.
+
+        Returns:
+            True if a full frame was copied, False if none was available
+        """
+        frame_size = self.frame_size
+        ring = self._ring
+        capacity = len(ring)
+        frame = self._frame_buffer
+
+        with self._buffer_ready:
+            if self._ring_count < frame_size:
+                self._buffer_ready.wait(self.BUFFER_WAIT_TIMEOUT)
+                if self._ring_count < frame_size:
+                    return False
+
+            read = self._ring_read
+            first = min(frame_size, capacity - read)
+            frame[:first] = ring[read : read + first]
+            frame[first:] = ring[: frame_size - first]
+            self._ring_read = (read + frame_size) % capacity
+            self._ring_count -= frame_size
+
+        return True
 
     def _process_audio(self):
         """Process audio data in a separate thread."""
+        # Values fixed for the lifetime of a detection run, bound once for
+        # the per-frame loop
+        frame_size = self.frame_size
+        sample_rate = self.sample_rate
+        use_simple_vad = self.use_simple_vad
+        vad = self.vad
+        frame_data = self._frame_buffer
+        pcm_buffer = self._pcm_buffer
+        read_frame = self._read_frame
+        state_lock = self._state_lock
+        emit = self._emit_signal_safely
+        voice_level_changed = self.voice_level_changed
+        speech_detected = self.speech_detected
+        voice_started = self.voice_started
+        voice_stopped = self.voice_stopped
+        dot = np.dot
+        now = time.monotonic
+
         while self.is_running:
             try:
-                # Check if we have enough data for processing (thread-safe)
-                with self._buffer_lock:
-                    buffer_length = len(self._audio_buffer)
-
-                if buffer_length >= self.frame_size:
-                    # Extract frame for processing (thread-safe)
-                    with self._buffer_lock:
-                        frame_data = self._audio_buffer[: self.frame_size].copy()
-                        self._audio_buffer = self._audio_buffer[self.frame_size :]
-
-                    # Calculate audio level (RMS)
-                    self.audio_level = float(np.sqrt(np.mean(frame_data**2)))
-                    self._emit_signal_safely("voice_level_changed", self.audio_level)
+                # Wait for a full frame of audio (thread-safe)
+                if read_frame():
+                    # Settings that may change while running, read once per
+                    # frame so a frame never mixes old and new values
+                    voice_threshold = self.voice_threshold
+                    start_delay = self.start_delay
+                    stop_delay = self.stop_delay
+
+                    # Calculate audio level (RMS); the dot product sums the
+                    # squares without allocating a temporary array
+                    audio_level = (
+                        float(dot(frame_data, frame_data)) / frame_size
+                    ) ** 0.5
 
                     # Determine if speech is detected using hybrid approach
-                    if self.use_simple_vad:
+                    if use_simple_vad:
                         # Pure threshold-based detection
-                        is_speech = self.audio_level > self.voice_threshold
+                        is_speech = audio_level > voice_threshold
                     else:
-                        # Combined WebRTC VAD + threshold for fine-grained control
-                        pcm_data = (frame_data * 32767).astype(np.int16)
-                        webrtc_speech = self.vad.is_speech(
-                            pcm_data.tobytes(), self.sample_rate
+                        # Combined WebRTC VAD + threshold for fine-grained control.
+                        # WebRTC VAD adapts its noise model and hangover state
+                        # on every frame it sees, so it must also run on quiet
+                        # frames even though the threshold alone rejects them.
+                        # Scale straight into the int16 buffer (truncating,
+                        # like astype) instead of allocating per frame
+                        np.multiply(
+                            frame_data,
+                            32767,
+                            out=pcm_buffer,
+                            casting="unsafe",
                         )
-                        threshold_speech = self.audio_level > self.voice_threshold
+                        webrtc_speech = vad.is_speech(pcm_buffer.tobytes(), sample_rate)
+                        threshold_speech = audio_level > voice_threshold
 
                         # Speech detected if BOTH WebRTC and threshold agree
                         # This provides more accurate detection with fine-grained control
                         is_speech = webrtc_speech and threshold_speech
 
-                    # Emit speech detection signal if state changed
-                    if is_speech != self.is_speech_detected:
-                        self.is_speech_detected = is_speech
-                        self._emit_signal_safely("speech_detected", is_speech)
-
-                    current_time = time.time()
-
-                    if is_speech:
-                        self.last_voice_time = current_time
-
-                        # Check if we should start speaking
-                        if (
-                            not self.is_speaking
-                            and current_time - self.last_silence_time
-                            >= self.start_delay
-                        ):
-                            self.is_speaking = True
-                            self._emit_signal_safely("voice_started")
-                    else:
-                        self.last_silence_time = current_time
-
-                        # Check if we should stop speaking
-                        if (
-                            self.is_speaking
-                            and current_time - self.last_voice_time >= self.stop_delay
-                        ):
-                            self.is_speaking = False
-                            self._emit_signal_safely("voice_stopped")
-                else:
-                    # Not enough data, wait a bit
-                    time.sleep(0.01)
+                    current_time = now()
+                    started = stopped = False
+
+                    # Update all detection state under one lock acquisition
+                    with state_lock:
+                        self._audio_level = audio_level
+                        speech_changed = is_speech != self._is_speech_detected
+                        self._is_speech_detected = is_speech
+
+                        if is_speech:
+                            self._last_voice_time = current_time
+
+                            # Check if we should start speaking
+                            if (
+                                not self._is_speaking
+                                and current_time - self._last_silence_time
+                                >= start_delay
+                            ):
+                                self._is_speaking = True
+                                started = True
+                        else:
+                            self._last_silence_time = current_time
+
+                            # Check if we should stop speaking
+                            if (
+                                self._is_speaking
+                                and current_time - self._last_voice_time >= stop_delay
+                            ):
+                                self._is_speaking = False
+                                stopped = True
+
+                    # Emit outside the lock so connected slots cannot block
+                    # the UI thread's state reads
+                    emit(voice_level_changed, audio_level)
+                    if speech_changed:
+                        emit(speech_detected, is_speech)
+                    if started:
+                        emit(voice_started)
+                    elif stopped:
+                        emit(voice_stopped)
 
             except Exception as e:
-                self._emit_signal_safely(
-                    "error_occurred", f"Audio processing error: {str(e)}"
-                )
+                self._emit_error(f"Audio processing error: {str(e)}")
                 break
 
     def get_audio_devices(self):
-        """Get list of available audio input devices."""
+        """Get list of available audio input devices.
+
+        The PortAudio query is reused for DEVICE_CACHE_TTL seconds; call
+        invalidate_device_cache to force a fresh one.
+        """
+        cached = self._devices_cache
+        if cached and time.monotonic() - cached[0] < self.DEVICE_CACHE_TTL:
+            return list(cached[1])
+
         try:
             devices = sd.query_devices()
             input_devices = []
@@ -385,22 +511,23 @@ class VoiceActivityDetector(QObject):
                             "default_samplerate": device["default_samplerate"],
                         }
                     )
-            return input_devices
+            self._devices_cache = (time.monotonic(), input_devices)
+            return list(input_devices)
         except Exception as e:
-            self._emit_signal_safely(
-                "error_occurred", f"Failed to get audio devices: {str(e)}"
-            )
+            self._emit_error(f"Failed to get audio devices: {str(e)}")
             return []
 
+    def invalidate_device_cache(self):
+        """Discard the cached device list so the next query hits PortAudio."""
+        self._devices_cache = None
+
     def set_audio_device(self, device_index: int | None):
         """Set the audio input device."""
         try:
             if device_index is not None:
                 sd.default.device[0] = device_index  # Set input device
         except Exception as e:
-            self._emit_signal_safely(
-                "error_occurred", f"Failed to set audio device: {str(e)}"
-            )
+            self._emit_error(f"Failed to set audio device: {str(e)}")
 
     def is_detection_running(self) -> bool:
         """Check if voice detection is currently running."""
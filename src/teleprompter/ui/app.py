@@ -164,6 +164,7 @@ class TeleprompterApp(QMainWindow, LoggerMixin):
         self.file_manager.file_loaded.connect(self._on_file_loaded)
         self.file_manager.error_occurred.connect(self._on_file_error)
         self.file_manager.file_reload_requested.connect(self._on_file_reload_requested)
+        self.file_manager.file_reloaded.connect(self._on_file_reloaded)
 
         # Connect toolbar manager signals
         self.toolbar_manager.open_file_requested.connect(
@@ -251,21 +252,30 @@ class TeleprompterApp(QMainWindow, LoggerMixin):
 
         self.log_info(f"Processing file reload request: {file_path}")
 
-        # Reload the file content
-        try:
-            # Load the new content
-            markdown_content = self.file_manager.load_file(file_path)
-            self.log_debug(f"Loaded markdown content, length: {len(markdown_content)}")
+        # Read and parse off the GUI thread; the result arrives via
+        # _on_file_reloaded
+        self.file_manager.reload_file_async(file_path)
 
-            html_content = self.file_manager._parser.parse_content(markdown_content)
-            self.log_debug(f"Parsed to HTML, length: {len(html_content)}")
+    def _on_file_reloaded(
+        self, html_content: str, file_path: str, markdown_content: str
+    ):
+        """Handle reloaded file content from file manager.
 
-            # Use the teleprompter's reload method that preserves position
-            self.teleprompter.reload_content_with_state(html_content)
+        Args:
+            html_content: Parsed HTML content
+            file_path: Path of the reloaded file
+            markdown_content: Raw file content
+        """
+        if file_path != self.file_manager.get_current_file_path():
+            self.log_debug(f"Ignoring reload of a file no longer open: {file_path}")
+            return
+
+        self.log_debug(f"Parsed to HTML, length: {len(html_content)}")
+
+        # Use the teleprompter's reload method that preserves position
+        self.teleprompter.reload_content_with_state(html_content)
 
-            self.log_info(f"File reloaded successfully: {file_path}")
-        except Exception as e:
-            self.log_error(f"Failed to reload file {file_path}: {str(e)}")
+        self.log_info(f"File reloaded successfully: {file_path}")
 
     def _reset_and_focus(self):
         """Reset teleprompter and ensure focus."""
@@ -1,16 +1,22 @@
 """Modern icon management for the teleprompter application."""
 
 import base64
+import math
+import re
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-from PyQt6.QtCore import QByteArray, Qt
-from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtCore import QByteArray, QRectF, Qt
+from PyQt6.QtGui import QGuiApplication, QPainter, QPixmap, QPixmapCache
 from PyQt6.QtSvg import QSvgRenderer
 
 from ...core.protocols import IconProviderProtocol
 from ...utils.resource_path import get_resource_path
 
+# Indentation and line breaks between tags, dropped when an icon is loaded
+_INTER_TAG_WHITESPACE = re.compile(rb">\s+<")
+
 
 class IconManager(IconProviderProtocol):
     """Manages SVG icons with modern UI design principles."""
@@ -35,11 +41,41 @@ class IconManager(IconProviderProtocol):
         "error": "#d13438",  # Error state
     }
 
+    # Transparent gap between atlas cells so antialiasing cannot bleed over
+    ATLAS_PADDING = 1
+
     def __init__(self):
         """Initialize the icon manager with modern defaults."""
         # Use resource path helper to handle both dev and bundled environments
-        self.icons_dir = Path(get_resource_path("src/teleprompter/infrastructure/icons"))
-        self._icon_cache = {}
+        self.icons_dir = Path(
+            get_resource_path("src/teleprompter/infrastructure/icons")
+        )
+        # QPixmapCache keys of rendered pixmaps; Qt owns and evicts the pixmaps
+        self._pixmap_keys: set[str] = set()
+        # Raw SVG bytes per icon name; b"" records a missing file
+        self._svg_source_cache: dict[str, bytes] = {}
+        # Parsed SVG per (icon name, color), shared by every size variant
+        self._renderer_cache: dict[tuple[str, str], QSvgRenderer] = {}
+        # Encoded data URLs per (icon name, color)
+        self._data_url_cache: dict[tuple[str, str], str] = {}
+
+    def get_svg_bytes(self, icon_name: str) -> bytes:
+        """Get the raw SVG file contents for an icon.
+
+        Args:
+            icon_name: Name of the icon (without .svg extension)
+
+        Returns:
+            SVG source as bytes, or empty bytes if not found
+        """
+        svg_bytes = self._svg_source_cache.get(icon_name)
+        if svg_bytes is None:
+            svg_path = self.icons_dir / f"{icon_name}.svg"
+            svg_bytes = svg_path.read_bytes() if svg_path.exists() else b""
+            # Minify once so every parse and data URL works on fewer bytes
+            svg_bytes = _INTER_TAG_WHITESPACE.sub(b"><", svg_bytes).strip()
+            self._svg_source_cache[icon_name] = svg_bytes
+        return svg_bytes
 
     def get_svg_content(self, icon_name: str) -> str:
         """Get the raw SVG content for an icon.
@@ -50,10 +86,7 @@ class IconManager(IconProviderProtocol):
         Returns:
             SVG content as string, or empty string if not found
         """
-        svg_path = self.icons_dir / f"{icon_name}.svg"
-        if svg_path.exists():
-            return svg_path.read_text(encoding="utf-8")
-        return ""
+        return self.get_svg_bytes(icon_name).decode("utf-8")
 
     def get_svg_data_url(self, icon_name: str, color: str = "currentColor") -> str:
         """Get a data URL for an SVG icon with optional color replacement.
@@ -65,21 +98,27 @@ class IconManager(IconProviderProtocol):
         Returns:
             Data URL string for use in CSS, or empty string if not found
         """
-        svg_content = self.get_svg_content(icon_name)
-        if not svg_content:
+        cache_key = (icon_name, color)
+        data_url = self._data_url_cache.get(cache_key)
+        if data_url is not None:
+            return data_url
+
+        svg_bytes = self.get_svg_bytes(icon_name)
+        if not svg_bytes:
             return ""
 
         # Replace currentColor with the specified color
         if color != "currentColor":
-            svg_content = svg_content.replace(
-                'stroke="currentColor"', f'stroke="{color}"'
+            svg_bytes = svg_bytes.replace(
+                b'stroke="currentColor"', f'stroke="{color}"'.encode()
             )
 
         # Encode for data URL
-        svg_bytes = svg_content.encode("utf-8")
-        svg_base64 = base64.b64encode(svg_bytes).decode("utf-8")
+        svg_base64 = base64.b64encode(svg_bytes).decode("ascii")
 
-        return f"data:image/svg+xml;base64,{svg_base64}"
+        data_url = f"data:image/svg+xml;base64,{svg_base64}"
+        self._data_url_cache[cache_key] = data_url
+        return data_url
 
     def get_pixmap(
         self,
@@ -106,29 +145,19 @@ class IconManager(IconProviderProtocol):
         if color is None:
             color = self.COLORS["default"]
 
-        cache_key = f"{icon_name}_{size[0]}x{size[1]}_{color}"
-
-        if cache_key in self._icon_cache:
-            return self._icon_cache[cache_key]
-
-        svg_content = self.get_svg_content(icon_name)
-        if not svg_content:
-            return QPixmap()
-
-        # Replace currentColor with the specified color
-        svg_content = svg_content.replace('stroke="currentColor"', f'stroke="{color}"')
-        # Also handle fill for icons that use fill instead of stroke
-        svg_content = svg_content.replace('fill="currentColor"', f'fill="{color}"')
+        dpr = self._device_pixel_ratio()
+        cache_key = self._pixmap_key(icon_name, size, color, dpr)
 
-        # Create QSvgRenderer and render to QPixmap
-        renderer = QSvgRenderer()
-        svg_bytes = QByteArray(svg_content.encode("utf-8"))
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            return pixmap
 
-        if not renderer.load(svg_bytes):
+        renderer = self._get_renderer(icon_name, color)
+        if renderer is None:
             return QPixmap()
 
-        # Use high DPI scaling for crisp icons
-        pixmap = QPixmap(size[0], size[1])
+        # Render at device resolution so HiDPI screens get crisp icons
+        pixmap = QPixmap(round(size[0] * dpr), round(size[1] * dpr))
         pixmap.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(pixmap)
@@ -136,10 +165,92 @@ class IconManager(IconProviderProtocol):
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         renderer.render(painter)
         painter.end()
+        pixmap.setDevicePixelRatio(dpr)
 
-        self._icon_cache[cache_key] = pixmap
+        self._cache_pixmap(cache_key, pixmap)
         return pixmap
 
+    @staticmethod
+    def _device_pixel_ratio() -> float:
+        """Get the primary screen's device pixel ratio.
+
+        Returns:
+            Device pixel ratio, or 1.0 when no screen is available
+        """
+        if QGuiApplication.instance() is None:
+            return 1.0
+        screen = QGuiApplication.primaryScreen()
+        return screen.devicePixelRatio() if screen is not None else 1.0
+
+    @staticmethod
+    def _pixmap_key(
+        icon_name: str, size: tuple[int, int], color: str, dpr: float
+    ) -> str:
+        """Build the QPixmapCache key for a rendered icon.
+
+        Args:
+            icon_name: Name of the icon (without .svg extension)
+            size: Logical (width, height) of the pixmap
+            color: Color the icon is rendered in
+            dpr: Device pixel ratio the pixmap is rendered at
+
+        Returns:
+            Cache key string
+        """
+        return f"cuebird-icon:{icon_name}:{size[0]}x{size[1]}:{color}@{dpr}"
+
+    def _cache_pixmap(self, cache_key: str, pixmap: QPixmap) -> None:
+        """Store a rendered pixmap in Qt's shared pixmap cache.
+
+        QPixmapCache bounds the total size and evicts on its own, so the
+        icon cache does not need a separate limit.
+
+        Args:
+            cache_key: Key from _pixmap_key
+            pixmap: Rendered pixmap to store
+        """
+        QPixmapCache.insert(cache_key, pixmap)
+        self._pixmap_keys.add(cache_key)
+
+    def _get_renderer(self, icon_name: str, color: str) -> QSvgRenderer | None:
+        """Get a loaded renderer for an icon in a given color.
+
+        The SVG is parsed once per (icon, color) pair and reused for every
+        size rendered from it.
+
+        Args:
+            icon_name: Name of the icon (without .svg extension)
+            color: Color to replace 'currentColor' with
+
+        Returns:
+            Loaded QSvgRenderer, or None if the icon is missing or invalid
+        """
+        renderer_key = (icon_name, color)
+        renderer = self._renderer_cache.get(renderer_key)
+        if renderer is not None:
+            return renderer
+
+        svg_bytes = self.get_svg_bytes(icon_name)
+        if not svg_bytes:
+            return None
+
+        # Replace currentColor with the specified color
+        color_bytes = color.encode()
+        svg_bytes = svg_bytes.replace(
+            b'stroke="currentColor"', b'stroke="' + color_bytes + b'"'
+        )
+        # Also handle fill for icons that use fill instead of stroke
+        svg_bytes = svg_bytes.replace(
+            b'fill="currentColor"', b'fill="' + color_bytes + b'"'
+        )
+
+        renderer = QSvgRenderer()
+        if not renderer.load(QByteArray(svg_bytes)):
+            return None
+
+        self._renderer_cache[renderer_key] = renderer
+        return renderer
+
     def get_themed_pixmap(
         self, icon_name: str, state: str = "default", size_key: str = "medium"
     ) -> QPixmap:
@@ -158,9 +269,96 @@ class IconManager(IconProviderProtocol):
 
         return self.get_pixmap(icon_name, size, color)
 
+    def warmup(
+        self,
+        icon_names: Iterable[str],
+        states: Iterable[str] = ("default",),
+        size_keys: Iterable[str] = ("medium",),
+    ) -> None:
+        """Render themed pixmaps ahead of first use.
+
+        Every combination of icon, state and size is rendered into the
+        pixmap cache, so later get_themed_pixmap calls are cache hits.
+
+        Args:
+            icon_names: Names of the icons to render
+            states: UI states to render each icon in
+            size_keys: Size categories to render each icon at
+        """
+        colors = [self.COLORS.get(state, self.COLORS["default"]) for state in states]
+        sizes = [self.SIZES.get(key, self.SIZES["medium"]) for key in size_keys]
+        self.warmup_atlas(
+            (icon_name, size, color)
+            for icon_name in icon_names
+            for color in colors
+            for size in sizes
+        )
+
+    def warmup_atlas(
+        self, icon_specs: Iterable[tuple[str, tuple[int, int], str]]
+    ) -> None:
+        """Render several icons in one painter session and cache them.
+
+        All uncached icons are drawn into a single grid-laid atlas pixmap
+        with one QPainter, then copied out cell by cell. This shares the
+        painter setup across the batch instead of paying it per icon.
+
+        Args:
+            icon_specs: (icon name, (width, height), color) tuples to render
+        """
+        dpr = self._device_pixel_ratio()
+        # (cache key, device width, device height, renderer) per icon to draw
+        pending: list[tuple[str, int, int, QSvgRenderer]] = []
+        seen: set[str] = set()
+        for icon_name, size, color in icon_specs:
+            cache_key = self._pixmap_key(icon_name, size, color, dpr)
+            if cache_key in seen:
+                continue
+            seen.add(cache_key)
+            if QPixmapCache.find(cache_key) is not None:
+                continue
+            renderer = self._get_renderer(icon_name, color)
+            if renderer is not None:
+                pending.append(
+                    (cache_key, round(size[0] * dpr), round(size[1] * dpr), renderer)
+                )
+
+        if not pending:
+            return
+
+        # Uniform cells in a near-square grid, laid out in device pixels
+        cell_width = max(spec[1] for spec in pending) + self.ATLAS_PADDING
+        cell_height = max(spec[2] for spec in pending) + self.ATLAS_PADDING
+        columns = math.ceil(math.sqrt(len(pending)))
+        rows = math.ceil(len(pending) / columns)
+
+        atlas = QPixmap(columns * cell_width, rows * cell_height)
+        atlas.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(atlas)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        cells = []
+        for index, (cache_key, width, height, renderer) in enumerate(pending):
+            row, column = divmod(index, columns)
+            x, y = column * cell_width, row * cell_height
+            renderer.render(painter, QRectF(x, y, width, height))
+            cells.append((cache_key, x, y, width, height))
+        painter.end()
+
+        for cache_key, x, y, width, height in cells:
+            pixmap = atlas.copy(x, y, width, height)
+            pixmap.setDevicePixelRatio(dpr)
+            self._cache_pixmap(cache_key, pixmap)
+
     def clear_cache(self):
         """Clear the icon cache to free memory."""
-        self._icon_cache.clear()
+        for cache_key in self._pixmap_keys:
+            QPixmapCache.remove(cache_key)
+        self._pixmap_keys.clear()
+        self._svg_source_cache.clear()
+        self._renderer_cache.clear()
+        self._data_url_cache.clear()
 
     def get_icon(self, name: str, size: int | None = None) -> Any:
         """Get an icon by name.
@@ -7,64 +7,9 @@ from ...core import config
 # Global instance for backward compatibility
 _style_manager_instance = None
 
-
-class StyleManager:
-    """Manages application styling, themes, and CSS generation.
-
-    The StyleManager centralizes all styling concerns for the teleprompter
-    application, providing consistent Material Design-inspired themes and
-    CSS stylesheets for different UI components.
-
-    Key responsibilities:
-    - Generate CSS stylesheets for different widget types
-    - Manage theme variables and color schemes
-    - Provide consistent styling across the application
-    - Support for responsive design and accessibility
-
-    Attributes:
-        _current_theme (str): Currently active theme name.
-        _theme_variables (dict): Theme-specific variables like colors and fonts.
-
-    Note:
-        The StyleManager follows a singleton-like pattern for consistent
-        styling across the application. All stylesheet methods return
-        CSS strings that can be applied directly to Qt widgets.
-    """
-
-    def __init__(self):
-        """Initialize the style manager with default theme settings.
-
-        Sets up the default theme variables including background colors,
-        text colors, font families, and other styling parameters from
-        the application configuration.
-        """
-        self._current_theme = "default"
-        self._theme_variables = {
-            "background_color": config.BACKGROUND_COLOR,
-            "text_color": config.TEXT_COLOR,
-            "font_family": ", ".join(config.FONT_FAMILIES),
-            "default_font_size": config.DEFAULT_FONT_SIZE,
-        }
-
-    def get_application_stylesheet(self) -> str:
-        """Get the complete application-wide stylesheet.
-
-        Generates a comprehensive CSS stylesheet for the main application
-        window and common UI components including:
-        - Main window background and colors
-        - Enhanced toolbar with Material Design styling
-        - Consistent spacing, borders, and typography
-        - Hover and focus states for interactive elements
-
-        Returns:
-            str: Complete CSS stylesheet ready for application to QMainWindow.
-
-        Note:
-            This stylesheet provides the base styling that applies to the
-            entire application. Individual widgets may override specific
-            styles using their own stylesheet methods.
-        """
-        return f"""
+# Stylesheets interpolated from config, formatted once at import. The
+# config values they read are never changed at runtime.
+_APPLICATION_STYLESHEET = f"""
             /* Main window styling */
             QMainWindow {{
                 background-color: #0f0f0f;
@@ -330,6 +275,179 @@ class StyleManager:
             }}
         """
 
+_BACKGROUND_STYLESHEET = f"background-color: {config.BACKGROUND_COLOR};"
+
+_TELEPROMPTER_INFO_OVERLAY_STYLESHEET = f"""
+            QWidget {{
+                background-color: rgba(15, 15, 15, 0.9);
+                color: #e0e0e0;
+                border-radius: {config.MATERIAL_BORDER_RADIUS["small"]}px;
+                padding: 8px;
+            }}
+        """
+
+
+# Voice button colours per state, shared by the combined [voiceState]
+# stylesheet and the per-state getters. "hover" and "pressed" override the
+# properties of the base state rule.
+_VOICE_BUTTON_STATES: dict[str, dict[str, dict[str, str]]] = {
+    "disabled": {
+        "base": {
+            "background-color": "#2a2a2a",
+            "border": "1px solid #404040",
+            "color": "#666666",
+        },
+        "hover": {
+            "background-color": "#333333",
+            "border-color": "#505050",
+            "color": "#888888",
+        },
+    },
+    "loading": {
+        "base": {
+            "background-color": "#555555",
+            "border": "2px solid #777777",
+            "color": "white",
+        },
+        "hover": {"background-color": "#666666", "border-color": "#888888"},
+    },
+    "listening": {
+        "base": {
+            "background-color": "#0078d4",
+            "border": "1px solid #005a9e",
+            "color": "white",
+        },
+        "hover": {"background-color": "#106ebe", "border-color": "#0052a0"},
+    },
+    "speaking": {
+        "base": {
+            "background-color": "#4CAF50",
+            "border": "1px solid #388E3C",
+            "color": "white",
+        },
+        "hover": {"background-color": "#66BB6A", "border-color": "#43A047"},
+    },
+    "error": {
+        "base": {
+            "background-color": "rgba(255, 100, 100, 0.3)",
+            "border": "2px solid rgba(255, 100, 100, 0.6)",
+            "color": "#ff6464",
+        },
+        "hover": {
+            "background-color": "rgba(255, 100, 100, 0.4)",
+            "border-color": "rgba(255, 100, 100, 0.8)",
+        },
+        "pressed": {
+            "background-color": "rgba(255, 100, 100, 0.2)",
+            "border-color": "rgba(255, 100, 100, 0.4)",
+        },
+    },
+}
+
+_VOICE_BUTTON_BASE_RULE = """
+            QPushButton#voiceButton {
+                border-radius: 4px;
+                font-size: 12px;
+                min-width: 25px;
+                max-width: 25px;
+                min-height: 25px;
+                max-height: 25px;
+                padding: 6px;
+            }
+"""
+
+
+def _voice_button_state_rules(selector: str, state: str) -> str:
+    """Build the rules styling one voice button state.
+
+    Args:
+        selector: Selector the state's rules apply to
+        state: Key into _VOICE_BUTTON_STATES
+
+    Returns:
+        Stylesheet rules for the state and its pseudo-states
+    """
+    rules = []
+    for pseudo, properties in _VOICE_BUTTON_STATES[state].items():
+        suffix = "" if pseudo == "base" else f":{pseudo}"
+        body = "".join(
+            f"                {name}: {value};\n" for name, value in properties.items()
+        )
+        rules.append(f"            {selector}{suffix} {{\n{body}            }}\n")
+    return "".join(rules)
+
+
+# Formatted once at import, like the config-driven sheets above
+_VOICE_BUTTON_STATE_STYLESHEETS = {
+    state: _VOICE_BUTTON_BASE_RULE
+    + _voice_button_state_rules("QPushButton#voiceButton", state)
+    for state in _VOICE_BUTTON_STATES
+}
+_VOICE_BUTTON_STATES_STYLESHEET = _VOICE_BUTTON_BASE_RULE + "".join(
+    "\n"
+    + _voice_button_state_rules(f'QPushButton#voiceButton[voiceState="{state}"]', state)
+    for state in _VOICE_BUTTON_STATES
+)
+
+
+class StyleManager:
+    """Manages application styling, themes, and CSS generation.
+
+    The StyleManager centralizes all styling concerns for the teleprompter
+    application, providing consistent Material Design-inspired themes and
+    CSS stylesheets for different UI components.
+
+    Key responsibilities:
+    - Generate CSS stylesheets for different widget types
+    - Manage theme variables and color schemes
+    - Provide consistent styling across the application
+    - Support for responsive design and accessibility
+
+    Attributes:
+        _current_theme (str): Currently active theme name.
+        _theme_variables (dict): Theme-specific variables like colors and fonts.
+
+    Note:
+        The StyleManager follows a singleton-like pattern for consistent
+        styling across the application. All stylesheet methods return
+        CSS strings that can be applied directly to Qt widgets.
+    """
+
+    def __init__(self):
+        """Initialize the style manager with default theme settings.
+
+        Sets up the default theme variables including background colors,
+        text colors, font families, and other styling parameters from
+        the application configuration.
+        """
+        self._current_theme = "default"
+        self._theme_variables = {
+            "background_color": config.BACKGROUND_COLOR,
+            "text_color": config.TEXT_COLOR,
+            "font_family": ", ".join(config.FONT_FAMILIES),
+            "default_font_size": config.DEFAULT_FONT_SIZE,
+        }
+
+    def get_application_stylesheet(self) -> str:
+        """Get the complete application-wide stylesheet.
+
+        Generates a comprehensive CSS stylesheet for the main application
+        window and common UI components including:
+        - Main window background and colors
+        - Enhanced toolbar with Material Design styling
+        - Consistent spacing, borders, and typography
+        - Hover and focus states for interactive elements
+
+        Returns:
+            str: Complete CSS stylesheet ready for application to QMainWindow.
+
+        Note:
+            This stylesheet provides the base styling that applies to the
+            entire application. Individual widgets may override specific
+            styles using their own stylesheet methods.
+        """
+        return _APPLICATION_STYLESHEET
+
     def get_toolbar_group_label_stylesheet(self) -> str:
         """Get stylesheet for toolbar group labels.
 
@@ -520,25 +638,7 @@ class StyleManager:
         Returns:
             CSS stylesheet for disabled voice button
         """
-        return """
-            QPushButton#voiceButton {
-                background-color: #2a2a2a;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                color: #666666;
-                font-size: 12px;
-                min-width: 25px;
-                max-width: 25px;
-                min-height: 25px;
-                max-height: 25px;
-                padding: 6px;
-            }
-            QPushButton#voiceButton:hover {
-                background-color: #333333;
-                border-color: #505050;
-                color: #888888;
-            }
-        """
+        return _VOICE_BUTTON_STATE_STYLESHEETS["disabled"]
 
     def get_voice_button_speaking_stylesheet(self) -> str:
         """Get stylesheet for voice button when speaking is detected.
@@ -546,24 +646,7 @@ class StyleManager:
         Returns:
             CSS stylesheet for speaking voice button
         """
-        return """
-            QPushButton#voiceButton {
-                background-color: #4CAF50;
-                border: 1px solid #388E3C;
-                border-radius: 4px;
-                color: white;
-                font-size: 12px;
-                min-width: 25px;
-                max-width: 25px;
-                min-height: 25px;
-                max-height: 25px;
-                padding: 6px;
-            }
-            QPushButton#voiceButton:hover {
-                background-color: #66BB6A;
-                border-color: #43A047;
-            }
-        """
+        return _VOICE_BUTTON_STATE_STYLESHEETS["speaking"]
 
     def get_voice_button_listening_stylesheet(self) -> str:
         """Get stylesheet for voice button when listening (active but no speech).
@@ -571,63 +654,28 @@ class StyleManager:
         Returns:
             CSS stylesheet for listening voice button
         """
-        return """
-            QPushButton#voiceButton {
-                background-color: #0078d4;
-                border: 1px solid #005a9e;
-                border-radius: 4px;
-                color: white;
-                font-size: 12px;
-                min-width: 25px;
-                max-width: 25px;
-                min-height: 25px;
-                max-height: 25px;
-                padding: 6px;
-            }
-            QPushButton#voiceButton:hover {
-                background-color: #106ebe;
-                border-color: #0052a0;
-            }
-        """
+        return _VOICE_BUTTON_STATE_STYLESHEETS["listening"]
 
     def get_voice_button_error_stylesheet(self) -> str:
         """Get voice button error state stylesheet."""
-        return """
-            QPushButton {
-                background-color: rgba(255, 100, 100, 0.3);
-                border: 2px solid rgba(255, 100, 100, 0.6);
-                color: #ff6464;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 100, 100, 0.4);
-                border-color: rgba(255, 100, 100, 0.8);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 100, 100, 0.2);
-                border-color: rgba(255, 100, 100, 0.4);
-            }
-        """
+        return _VOICE_BUTTON_STATE_STYLESHEETS["error"]
 
     def get_voice_button_loading_stylesheet(self) -> str:
         """Get voice button loading state stylesheet."""
-        return """
-            QPushButton#voiceButton {
-                background-color: #555555;
-                border: 2px solid #777777;
-                border-radius: 4px;
-                color: white;
-                font-size: 12px;
-                min-width: 25px;
-                max-width: 25px;
-                min-height: 25px;
-                max-height: 25px;
-                padding: 6px;
-            }
-            QPushButton#voiceButton:hover {
-                background-color: #666666;
-                border-color: #888888;
-            }
+        return _VOICE_BUTTON_STATE_STYLESHEETS["loading"]
+
+    def get_voice_button_states_stylesheet(self) -> str:
+        """Get one stylesheet covering every voice button state.
+
+        The state is selected through the button's ``voiceState`` dynamic
+        property ('disabled', 'loading', 'listening', 'speaking' or
+        'error'), so state changes only need a re-polish instead of a new
+        stylesheet being parsed.
+
+        Returns:
+            CSS stylesheet for the voice button in all states
         """
+        return _VOICE_BUTTON_STATES_STYLESHEET
 
     def get_progress_bar_stylesheet(self) -> str:
         """Get progress bar stylesheet."""
@@ -635,11 +683,11 @@ class StyleManager:
 
     def get_main_window_stylesheet(self) -> str:
         """Get main window background stylesheet."""
-        return f"background-color: {config.BACKGROUND_COLOR};"
+        return _BACKGROUND_STYLESHEET
 
     def get_web_view_stylesheet(self) -> str:
         """Get web view background stylesheet."""
-        return f"background-color: {config.BACKGROUND_COLOR};"
+        return _BACKGROUND_STYLESHEET
 
     def get_mobile_info_overlay_stylesheet(self) -> str:
         """Get mobile-specific info overlay stylesheet."""
@@ -678,14 +726,7 @@ class StyleManager:
 
     def get_teleprompter_info_overlay_stylesheet(self) -> str:
         """Get stylesheet for teleprompter info overlay."""
-        return f"""
-            QWidget {{
-                background-color: rgba(15, 15, 15, 0.9);
-                color: #e0e0e0;
-                border-radius: {config.MATERIAL_BORDER_RADIUS["small"]}px;
-                padding: 8px;
-            }}
-        """
+        return _TELEPROMPTER_INFO_OVERLAY_STYLESHEET
 
     def get_teleprompter_info_labels_stylesheet(self) -> str:
         """Get stylesheet for teleprompter info labels."""
@@ -757,6 +798,7 @@ class StyleManager:
             "voice_button_active": self.get_voice_button_active_stylesheet,
             "voice_button_error": self.get_voice_button_error_stylesheet,
             "voice_button_loading": self.get_voice_button_loading_stylesheet,
+            "voice_button_states": self.get_voice_button_states_stylesheet,
             "progress_bar": self.get_progress_bar_stylesheet,
             "main_window_background": self.get_main_window_background_stylesheet,
             "web_view_background": self.get_web_view_background_stylesheet,
@@ -8,9 +8,11 @@ from abc import abstractmethod
 from typing import Any
 
 from PyQt6.QtCore import QEasingCurve, QObject, QPropertyAnimation, QTimer, pyqtProperty
-from PyQt6.QtGui import QEnterEvent
+from PyQt6.QtGui import QEnterEvent, QIcon
 from PyQt6.QtWidgets import QPushButton, QWidget
 
+from ...managers.icon_manager import icon_manager
+
 
 class AnimatedWidgetBase(QWidget):
     """Base class for widgets with animation capabilities."""
@@ -164,10 +166,30 @@ class ModernButtonBase(QPushButton, AnimatedWidgetBase):
 class ModernSpinBoxBase(AnimatedWidgetBase):
     """Base class for modern spin boxes with custom styling."""
 
+    # Arrow icons shared by every spin box instance, built on first use
+    _UP_ICON: QIcon | None = None
+    _DOWN_ICON: QIcon | None = None
+    _icons_loaded = False
+
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
         self._setup_spinbox_style()
 
+    @classmethod
+    def _ensure_class_icons(cls) -> None:
+        """Build the shared arrow icons once for all spin box subclasses."""
+        if ModernSpinBoxBase._icons_loaded:
+            return
+
+        # Use small size for spinbox arrows
+        up_pixmap = icon_manager.get_themed_pixmap("chevron-up", "default", "small")
+        down_pixmap = icon_manager.get_themed_pixmap("chevron-down", "default", "small")
+
+        if not up_pixmap.isNull() and not down_pixmap.isNull():
+            ModernSpinBoxBase._UP_ICON = QIcon(up_pixmap)
+            ModernSpinBoxBase._DOWN_ICON = QIcon(down_pixmap)
+        ModernSpinBoxBase._icons_loaded = True
+
     @abstractmethod
     def _setup_spinbox_style(self) -> None:
         """Set up spinbox-specific styling."""
@@ -13,6 +13,22 @@ from ...core.protocols import (
 from .javascript_manager import JavaScriptManager
 
 
+def set_html_utf8(web_view, html_content: str, base_url) -> None:
+    """Load an HTML document into a web view.
+
+    Passes UTF-8 bytes directly; setHtml would convert the str to a QString
+    only to re-encode it as UTF-8 internally.
+
+    Args:
+        web_view: QWebEngineView to load the document into
+        html_content: Complete HTML document
+        base_url: QUrl used to resolve relative URLs in the document
+    """
+    web_view.setContent(
+        html_content.encode("utf-8"), "text/html;charset=UTF-8", base_url
+    )
+
+
 class ContentLoadResult:
     """Encapsulates the result of a content loading operation.
 
@@ -264,7 +280,7 @@ class WebViewContentManager:
 
         # Create a unique URL to bypass any potential caching
         base_url = QUrl(f"local://content/{int(time.time() * 1000)}")
-        self._web_view.setHtml(html_content, base_url)
+        set_html_utf8(self._web_view, html_content, base_url)
 
         # Inject scripts after content loads
         self._web_view.loadFinished.connect(self._on_load_finished)
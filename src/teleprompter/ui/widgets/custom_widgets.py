@@ -1,5 +1,7 @@
 """Modern custom spinbox widgets with refined icons and styling."""
 
+from collections.abc import Callable
+
 from PyQt6.QtCore import QEasingCurve, QPropertyAnimation, QRect, pyqtSignal
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
@@ -10,7 +12,6 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from ..managers.icon_manager import icon_manager
 from ..managers.style_manager import StyleManager
 from .base.base_widgets import (
     DebouncedActionMixin,
@@ -20,6 +21,28 @@ from .base.base_widgets import (
     PulseAnimationBase,
 )
 
+_UP_TOOLTIP = "Increase value"
+_DOWN_TOOLTIP = "Decrease value"
+_UP_FALLBACK = "⌃"
+_DOWN_FALLBACK = "⌄"
+
+
+def _make_arrow_button(
+    parent: QWidget,
+    icon: QIcon | None,
+    tooltip: str,
+    slot: Callable[[], None],
+    style: str,
+) -> QPushButton:
+    """Create a spinbox arrow button with shared icon, tooltip and styling."""
+    button = QPushButton(parent)
+    button.setStyleSheet(style)
+    button.clicked.connect(slot)
+    if icon is not None:
+        button.setIcon(icon)
+    button.setToolTip(tooltip)
+    return button
+
 
 class ModernSpinBox(QSpinBox, ModernSpinBoxBase):
     """Modern QSpinBox with proper icon integration and refined styling."""
@@ -35,40 +58,28 @@ class ModernSpinBox(QSpinBox, ModernSpinBoxBase):
         # Hide default arrows
         self.setButtonSymbols(QSpinBox.ButtonSymbols.NoButtons)
 
-        # Create custom buttons with modern styling
-        self._up_button = QPushButton(self)
-        self._down_button = QPushButton(self)
-
-        # Modern button styling with proper scaling
+        # Create custom buttons sharing the class-level icons
+        self._ensure_class_icons()
         button_style = StyleManager().get_spinbox_button_stylesheet()
+        self._up_button = _make_arrow_button(
+            self, self._UP_ICON, _UP_TOOLTIP, self.stepUp, button_style
+        )
+        self._down_button = _make_arrow_button(
+            self, self._DOWN_ICON, _DOWN_TOOLTIP, self.stepDown, button_style
+        )
 
-        self._up_button.setStyleSheet(button_style)
-        self._down_button.setStyleSheet(button_style)
-
-        # Connect buttons
-        self._up_button.clicked.connect(self.stepUp)
-        self._down_button.clicked.connect(self.stepDown)
-
-        # Load modern icons with proper sizing
-        self._update_icons()
-
-        # Set tooltips for better UX
-        self._up_button.setToolTip("Increase value")
-        self._down_button.setToolTip("Decrease value")
+        # Fallback to modern Unicode arrows when icons are unavailable
+        if self._UP_ICON is None or self._DOWN_ICON is None:
+            self._update_icons()
 
     def _update_icons(self):
         """Update icons with proper theming."""
-        # Use small size for spinbox arrows
-        up_pixmap = icon_manager.get_themed_pixmap("chevron-up", "default", "small")
-        down_pixmap = icon_manager.get_themed_pixmap("chevron-down", "default", "small")
-
-        if not up_pixmap.isNull() and not down_pixmap.isNull():
-            self._up_button.setIcon(QIcon(up_pixmap))
-            self._down_button.setIcon(QIcon(down_pixmap))
+        if self._UP_ICON is not None and self._DOWN_ICON is not None:
+            self._up_button.setIcon(self._UP_ICON)
+            self._down_button.setIcon(self._DOWN_ICON)
         else:
-            # Fallback to modern Unicode arrows
-            self._up_button.setText("⌃")
-            self._down_button.setText("⌄")
+            self._up_button.setText(_UP_FALLBACK)
+            self._down_button.setText(_DOWN_FALLBACK)
 
     def resizeEvent(self, event):
         """Position the custom buttons with proper margins."""
@@ -116,40 +127,28 @@ class ModernDoubleSpinBox(QDoubleSpinBox, ModernSpinBoxBase):
         # Hide default arrows
         self.setButtonSymbols(QDoubleSpinBox.ButtonSymbols.NoButtons)
 
-        # Create custom buttons with modern styling
-        self._up_button = QPushButton(self)
-        self._down_button = QPushButton(self)
-
-        # Modern button styling with proper scaling
+        # Create custom buttons sharing the class-level icons
+        self._ensure_class_icons()
         button_style = StyleManager().get_spinbox_button_stylesheet()
+        self._up_button = _make_arrow_button(
+            self, self._UP_ICON, _UP_TOOLTIP, self.stepUp, button_style
+        )
+        self._down_button = _make_arrow_button(
+            self, self._DOWN_ICON, _DOWN_TOOLTIP, self.stepDown, button_style
+        )
 
-        self._up_button.setStyleSheet(button_style)
-        self._down_button.setStyleSheet(button_style)
-
-        # Connect buttons
-        self._up_button.clicked.connect(self.stepUp)
-        self._down_button.clicked.connect(self.stepDown)
-
-        # Load modern icons with proper sizing
-        self._update_icons()
-
-        # Set tooltips for better UX
-        self._up_button.setToolTip("Increase value")
-        self._down_button.setToolTip("Decrease value")
+        # Fallback to modern Unicode arrows when icons are unavailable
+        if self._UP_ICON is None or self._DOWN_ICON is None:
+            self._update_icons()
 
     def _update_icons(self):
         """Update icons with proper theming."""
-        # Use small size for spinbox arrows
-        up_pixmap = icon_manager.get_themed_pixmap("chevron-up", "default", "small")
-        down_pixmap = icon_manager.get_themed_pixmap("chevron-down", "default", "small")
-
-        if not up_pixmap.isNull() and not down_pixmap.isNull():
-            self._up_button.setIcon(QIcon(up_pixmap))
-            self._down_button.setIcon(QIcon(down_pixmap))
+        if self._UP_ICON is not None and self._DOWN_ICON is not None:
+            self._up_button.setIcon(self._UP_ICON)
+            self._down_button.setIcon(self._DOWN_ICON)
         else:
-            # Fallback to modern Unicode arrows
-            self._up_button.setText("⌃")
-            self._down_button.setText("⌄")
+            self._up_button.setText(_UP_FALLBACK)
+            self._down_button.setText(_DOWN_FALLBACK)
 
     def resizeEvent(self, event):
         """Position the custom buttons with proper margins."""
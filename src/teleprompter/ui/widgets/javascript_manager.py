@@ -1,5 +1,65 @@
 """JavaScript code management for the teleprompter widget."""
 
+# Size rules injected into the page, scaled from the custom properties set
+# by get_font_size_script
+_FONT_SIZE_CSS = """
+                body {
+                    font-size: var(--teleprompter-font-size) !important;
+                    line-height: 1.6 !important;
+                    padding-bottom: var(--teleprompter-bottom-padding) !important;
+                }
+
+                h1 { font-size: calc(var(--teleprompter-font-size) * 2.5) !important; }
+                h2 { font-size: calc(var(--teleprompter-font-size) * 2.0) !important; }
+                h3 { font-size: calc(var(--teleprompter-font-size) * 1.7) !important; }
+                h4 { font-size: calc(var(--teleprompter-font-size) * 1.5) !important; }
+                h5 { font-size: calc(var(--teleprompter-font-size) * 1.3) !important; }
+                h6 { font-size: calc(var(--teleprompter-font-size) * 1.1) !important; }
+
+                p, li, td, th {
+                    font-size: var(--teleprompter-font-size) !important;
+                }
+
+                code {
+                    font-size: calc(var(--teleprompter-font-size) * 0.9) !important;
+                }
+
+                pre {
+                    font-size: calc(var(--teleprompter-font-size) * 0.85) !important;
+                }
+
+                blockquote {
+                    font-size: calc(var(--teleprompter-font-size) * 0.95) !important;
+                }
+
+                .empty-title {
+                    font-size: calc(var(--teleprompter-font-size) * 1.75) !important;
+                }
+
+                .empty-subtitle {
+                    font-size: calc(var(--teleprompter-font-size) * 1.25) !important;
+                }
+
+                .error-title {
+                    font-size: calc(var(--teleprompter-font-size) * 1.5) !important;
+                }
+
+                .error-message {
+                    font-size: var(--teleprompter-font-size) !important;
+                }
+
+                .loading-text {
+                    font-size: calc(var(--teleprompter-font-size) * 1.25) !important;
+                }
+
+                /* Responsive adjustments */
+                @media (max-width: 768px) {
+                    body { font-size: calc(var(--teleprompter-font-size) * 0.9) !important; }
+                    h1 { font-size: calc(var(--teleprompter-font-size) * 2.0) !important; }
+                    h2 { font-size: calc(var(--teleprompter-font-size) * 1.75) !important; }
+                }
+            """
+
 
 class JavaScriptManager:
     """Manages JavaScript code for the teleprompter widget."""
@@ -109,80 +169,27 @@ class JavaScriptManager:
     def get_font_size_script(font_size: int, padding: int) -> str:
         """Get JavaScript for applying font size.
 
+        The size rules are written against CSS custom properties and added
+        to the page once, so a size change only updates two property values
+        on the document element instead of replacing a stylesheet.
+
         Args:
             font_size: The font size in pixels
             padding: The bottom padding percentage
         """
         return f"""
         (function() {{
-            const style = document.createElement('style');
-            style.textContent = `
-                body {{
-                    font-size: {font_size}px !important;
-                    line-height: 1.6 !important;
-                    padding-bottom: {padding}vh !important;
-                }}
-
-                h1 {{ font-size: {font_size * 2.5}px !important; }}
-                h2 {{ font-size: {font_size * 2.0}px !important; }}
-                h3 {{ font-size: {font_size * 1.7}px !important; }}
-                h4 {{ font-size: {font_size * 1.5}px !important; }}
-                h5 {{ font-size: {font_size * 1.3}px !important; }}
-                h6 {{ font-size: {font_size * 1.1}px !important; }}
-
-                p, li, td, th {{
-                    font-size: {font_size}px !important;
-                }}
-
-                code {{
-                    font-size: {font_size * 0.9}px !important;
-                }}
-
-                pre {{
-                    font-size: {font_size * 0.85}px !important;
-                }}
-
-                blockquote {{
-                    font-size: {font_size * 0.95}px !important;
-                }}
-
-                .empty-title {{
-                    font-size: {font_size * 1.75}px !important;
-                }}
-
-                .empty-subtitle {{
-                    font-size: {font_size * 1.25}px !important;
-                }}
-
-                .error-title {{
-                    font-size: {font_size * 1.5}px !important;
-                }}
-
-                .error-message {{
-                    font-size: {font_size}px !important;
-                }}
-
-                .loading-text {{
-                    font-size: {font_size * 1.25}px !important;
-                }}
-
-                /* Responsive adjustments */
-                @media (max-width: 768px) {{
-                    body {{ font-size: {font_size * 0.9}px !important; }}
-                    h1 {{ font-size: {font_size * 2.0}px !important; }}
-                    h2 {{ font-size: {font_size * 1.75}px !important; }}
-                }}
-            `;
-
-            // Remove any existing font size styles
-            const existingStyle = document.getElementById('teleprompter-font-style');
-            if (existingStyle) {{
-                existingStyle.remove();
+            const root = document.documentElement;
+            root.style.setProperty('--teleprompter-font-size', '{font_size}px');
+            root.style.setProperty('--teleprompter-bottom-padding', '{padding}vh');
+
+            if (!document.getElementById('teleprompter-font-style')) {{
+                const style = document.createElement('style');
+                style.id = 'teleprompter-font-style';
+                style.textContent = `{_FONT_SIZE_CSS}`;
+                document.head.appendChild(style);
             }}
 
-            style.id = 'teleprompter-font-style';
-            document.head.appendChild(style);
-
             console.log('Font size applied:', '{font_size}px');
         }})();
         """
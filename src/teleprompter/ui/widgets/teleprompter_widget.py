@@ -25,7 +25,12 @@ from ...core.protocols import (
 )
 from ..managers.responsive_manager import ResponsiveLayoutManager
 from ..managers.style_manager import StyleManager
-from .content_loader import ContentLoader, ContentLoadResult, WebViewContentManager
+from .content_loader import (
+    ContentLoader,
+    ContentLoadResult,
+    WebViewContentManager,
+    set_html_utf8,
+)
 from .javascript_manager import JavaScriptManager
 from .keyboard_commands import KeyboardCommandRegistry
 
@@ -382,7 +387,7 @@ class TeleprompterWidget(QWidget):
     @current_position.setter
     def current_position(self, value):
         """Set scroll position."""
-        self.scroll_controller._scroll_position = value
+        self.scroll_controller.update_scroll_position(value)
 
     @property
     def content_height(self):
@@ -392,7 +397,9 @@ class TeleprompterWidget(QWidget):
     @content_height.setter
     def content_height(self, value):
         """Set content height."""
-        self.scroll_controller._content_height = value
+        self.scroll_controller.set_viewport_dimensions(
+            self.scroll_controller._viewport_height, value
+        )
 
     @property
     def show_progress(self):
@@ -1137,7 +1144,7 @@ class TeleprompterWidget(QWidget):
 
         # Use timestamp to ensure unique URL and bypass any caching
         base_url = QUrl(f"local://reload/{int(time.time() * 1000)}")
-        self.web_view.setHtml(html_content, base_url)
+        set_html_utf8(self.web_view, html_content, base_url)
 
         # Update current content
         self.current_content = html_content
@@ -1,6 +1,6 @@
 """Voice control widget for teleprompter."""
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -50,8 +50,8 @@ class VoiceControlWidget(QWidget):
             parent: Parent widget, typically the main toolbar.
 
         Note:
-            The widget automatically populates available audio devices
-            and applies application styling on initialization.
+            The widget applies application styling on initialization and
+            populates available audio devices once the event loop runs.
         """
         super().__init__(parent)
 
@@ -97,6 +97,11 @@ class VoiceControlWidget(QWidget):
             + "• Green: Speech detected"
         )
         self.voice_button.setObjectName("voiceButton")
+        # States are switched through the voiceState property, see
+        # _set_voice_button_state
+        self.voice_button.setStyleSheet(
+            StyleManager().get_voice_button_states_stylesheet()
+        )
         self.voice_button.setSizePolicy(
             QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed
         )
@@ -127,10 +132,12 @@ class VoiceControlWidget(QWidget):
         )
         self.device_combo.setToolTip("Select microphone")
         self.device_combo.setObjectName("deviceCombo")
-        self._populate_audio_devices()
-        self.device_combo.currentIndexChanged.connect(self._on_device_changed)
         layout.addWidget(self.device_combo)
 
+        # Enumerating devices can stall in PortAudio, so list them after the
+        # window has had a chance to paint
+        QTimer.singleShot(0, self._setup_audio_devices)
+
         # Apply modern styling
         self._apply_modern_styling()
 
@@ -147,6 +154,15 @@ class VoiceControlWidget(QWidget):
         """
         self.setStyleSheet(StyleManager().get_voice_control_stylesheet())
 
+    def _setup_audio_devices(self):
+        """Fill the device list and start following device selection.
+
+        The selection signal is connected only after the first population,
+        so the initial list does not override the detector's default device.
+        """
+        self._populate_audio_devices()
+        self.device_combo.currentIndexChanged.connect(self._on_device_changed)
+
     def _populate_audio_devices(self):
         """Populate the audio device combo box with available microphones.
 
@@ -223,26 +239,32 @@ class VoiceControlWidget(QWidget):
         if not self.voice_button.isChecked():
             # Disabled state - darker gray with flat styling
             self.voice_button.setText("🎤")
-            self.voice_button.setStyleSheet(
-                StyleManager().get_voice_button_disabled_stylesheet()
-            )
+            self._set_voice_button_state("disabled")
         elif self._is_loading:
             # Loading state - waiting for microphone access
-            self.voice_button.setStyleSheet(
-                StyleManager().get_stylesheet("voice_button_loading")
-            )
+            self._set_voice_button_state("loading")
         elif self._is_speaking:
             # Active and speaking - green with flat styling
             self.voice_button.setText("🎤")
-            self.voice_button.setStyleSheet(
-                StyleManager().get_voice_button_speaking_stylesheet()
-            )
+            self._set_voice_button_state("speaking")
         else:
             # Active but listening (no speech) - blue with flat styling
             self.voice_button.setText("🎤")
-            self.voice_button.setStyleSheet(
-                StyleManager().get_voice_button_listening_stylesheet()
-            )
+            self._set_voice_button_state("listening")
+
+    def _set_voice_button_state(self, state: str):
+        """Switch the voice button to a state rule of its stylesheet.
+
+        Args:
+            state: 'disabled', 'loading', 'listening', 'speaking' or 'error'
+        """
+        if self.voice_button.property("voiceState") == state:
+            return
+        self.voice_button.setProperty("voiceState", state)
+        # Re-polish so the [voiceState] selectors are re-evaluated
+        style = self.voice_button.style()
+        style.unpolish(self.voice_button)
+        style.polish(self.voice_button)
 
     def _on_sensitivity_changed(self, value: int):
         """Handle sensitivity slider change."""
@@ -282,9 +304,7 @@ class VoiceControlWidget(QWidget):
         self._is_loading = False
 
         # Show error by setting button to red with flat styling and updating tooltip
-        self.voice_button.setStyleSheet(
-            StyleManager().get_voice_button_error_stylesheet()
-        )
+        self._set_voice_button_state("error")
         self.voice_button.setToolTip(f"Voice detection error: {error_message}")
 
         # Disable voice detection on error
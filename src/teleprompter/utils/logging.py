@@ -7,12 +7,52 @@ configuration for development and production environments.
 import logging
 import os
 import sys
+import time
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any
 
 import structlog
 from PyQt6.QtCore import QtMsgType, qInstallMessageHandler
 
+# psutil is optional and only needed for memory logging; it is imported on
+# first use to keep it off the startup path
+PSUTIL_AVAILABLE = find_spec("psutil") is not None
+_process = None
+
+# rich is optional; structlog uses it for console tracebacks when present
+RICH_AVAILABLE = find_spec("rich") is not None
+
+
+def _get_process():
+    """Get a psutil handle for the current process, created once.
+
+    Returns:
+        psutil.Process for this process
+    """
+    global _process
+    if _process is None:
+        import psutil
+
+        _process = psutil.Process()
+    return _process
+
+
+def _is_enabled_for(logger: Any, level: int) -> bool:
+    """Check whether a stdlib or structlog logger would emit at a level.
+
+    Args:
+        logger: logging.Logger or structlog bound logger
+        level: Numeric log level
+
+    Returns:
+        False only if the logger reports the level as filtered out
+    """
+    check = getattr(logger, "isEnabledFor", None) or getattr(
+        logger, "is_enabled_for", None
+    )
+    return check(level) if check is not None else True
+
 
 def setup_logging(
     *,
@@ -68,17 +108,18 @@ def setup_logging(
 
     # Choose final processors based on output format
     if is_terminal and enable_rich:
-        # Pretty console output for development
-        try:
-            # Try to use rich for beautiful console output
-            final_processors = [
-                structlog.dev.ConsoleRenderer(colors=True),
-            ]
-        except ImportError:
-            # Fallback to standard console renderer
-            final_processors = [
-                structlog.dev.ConsoleRenderer(colors=False),
-            ]
+        # Pretty console output for development, with rich tracebacks when
+        # rich is installed
+        final_processors = [
+            structlog.dev.ConsoleRenderer(
+                colors=True,
+                exception_formatter=(
+                    structlog.dev.rich_traceback
+                    if RICH_AVAILABLE
+                    else structlog.dev.plain_traceback
+                ),
+            ),
+        ]
     else:
         # JSON output for production/logging systems
         final_processors = [
@@ -295,14 +336,21 @@ class TeleprompterLogger:
 class LoggerMixin:
     """Mixin class to provide logging functionality to other classes."""
 
+    # Keeps the mixin usable by classes that define __slots__
+    __slots__ = ()
+
+    _class_logger: logging.Logger
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Create the logger for each subclass once, at class definition."""
+        super().__init_subclass__(**kwargs)
+        # Use full module and class name
+        cls._class_logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class."""
-        if not hasattr(self, "_logger"):
-            # Use full module and class name
-            logger_name = f"{self.__module__}.{self.__class__.__name__}"
-            self._logger = logging.getLogger(logger_name)
-        return self._logger
+        return type(self)._class_logger
 
     def log_debug(self, message: str, **kwargs: Any) -> None:
         """Log debug message with optional context."""
@@ -355,10 +403,9 @@ class PerformanceLogger:
 
     def start_timer(self, operation: str) -> None:
         """Start timing an operation."""
-        import time
-
         self._timers[operation] = time.perf_counter()
-        self.logger.debug("Timer started", operation=operation)
+        if _is_enabled_for(self.logger, logging.DEBUG):
+            self.logger.debug("Timer started", operation=operation)
 
     def end_timer(self, operation: str) -> float:
         """End timing and log the duration.
@@ -369,8 +416,6 @@ class PerformanceLogger:
         Returns:
             Duration in seconds
         """
-        import time
-
         if operation not in self._timers:
             self.logger.warning("No timer found", operation=operation)
             return 0.0
@@ -378,12 +423,13 @@ class PerformanceLogger:
         duration = time.perf_counter() - self._timers[operation]
         del self._timers[operation]
 
-        self.logger.info(
-            "Operation completed",
-            operation=operation,
-            duration_seconds=duration,
-            duration_ms=duration * 1000,
-        )
+        if _is_enabled_for(self.logger, logging.INFO):
+            self.logger.info(
+                "Operation completed",
+                operation=operation,
+                duration_seconds=duration,
+                duration_ms=duration * 1000,
+            )
         return duration
 
     def log_memory_usage(self, operation: str, **context: Any) -> None:
@@ -393,10 +439,8 @@ class PerformanceLogger:
             operation: Description of the operation
             **context: Additional context to include
         """
-        try:
-            import psutil
-
-            process = psutil.Process()
+        if PSUTIL_AVAILABLE:
+            process = _get_process()
             memory_info = process.memory_info()
 
             self.logger.info(
@@ -407,7 +451,7 @@ class PerformanceLogger:
                 percent=process.memory_percent(),
                 **context,
             )
-        except ImportError:
+        else:
             self.logger.warning(
                 "Memory logging unavailable",
                 operation=operation,
@@ -445,19 +489,19 @@ class TimerContext:
         self.logger = logger
         self.operation = operation
         self.start_time = None
+        # Resolved once so a filtered-out level skips building the event
+        self._debug_enabled = _is_enabled_for(logger, logging.DEBUG)
+        self._info_enabled = _is_enabled_for(logger, logging.INFO)
 
     def __enter__(self) -> "TimerContext":
         """Start timing."""
-        import time
-
         self.start_time = time.perf_counter()
-        self.logger.debug("Operation started", operation=self.operation)
+        if self._debug_enabled:
+            self.logger.debug("Operation started", operation=self.operation)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Stop timing and log result."""
-        import time
-
         if self.start_time is not None:
             duration = (time.perf_counter() - self.start_time) * 1000
 
@@ -468,7 +512,7 @@ class TimerContext:
                     duration_ms=duration,
                     exception=str(exc_val) if exc_val else None,
                 )
-            else:
+            elif self._info_enabled:
                 self.logger.info(
                     "Operation completed",
                     operation=self.operation,
@@ -526,12 +570,17 @@ def log_method_calls(logger: logging.Logger | None = None):
             # Use provided logger or class logger
             log = logger or getattr(self, "logger", logging.getLogger(func.__module__))
 
+            # Skip formatting the entry/exit messages when DEBUG is filtered
+            debug_enabled = _is_enabled_for(log, logging.DEBUG)
+
             # Log method entry
-            log.debug(f"Entering {func.__name__}")
+            if debug_enabled:
+                log.debug(f"Entering {func.__name__}")
 
             try:
                 result = func(self, *args, **kwargs)
-                log.debug(f"Exiting {func.__name__} successfully")
+                if debug_enabled:
+                    log.debug(f"Exiting {func.__name__} successfully")
                 return result
             except Exception as e:
                 log.error(f"Error in {func.__name__}: {e}", exc_info=True)
@@ -556,6 +605,11 @@ def log_performance(operation_name: str | None = None):
 
             # Get logger
             logger = getattr(self, "logger", logging.getLogger(func.__module__))
+
+            # Nothing would be emitted, so call straight through untimed
+            if not _is_enabled_for(logger, logging.INFO):
+                return func(self, *args, **kwargs)
+
             perf_logger = PerformanceLogger(logger)
 
             # Time the operation
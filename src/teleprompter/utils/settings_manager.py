@@ -7,6 +7,9 @@ from PyQt6.QtCore import QSettings
 
 from ..core.config import APPLICATION_NAME, DEFAULT_SPEED
 
+# Cache marker for keys known to be absent from the backing store
+_MISSING = object()
+
 
 class SettingsManager:
     """Manages application settings and user preferences."""
@@ -14,6 +17,8 @@ class SettingsManager:
     def __init__(self):
         """Initialize the settings manager."""
         self.settings = QSettings("CueBird", APPLICATION_NAME)
+        # Write-through cache so repeated reads skip the QSettings backend
+        self._cache: dict[str, Any] = {}
 
     def load_preferences(self) -> dict:
         """Load user preferences from application settings.
@@ -45,29 +50,47 @@ class SettingsManager:
             preferences: Dictionary containing preferences to save
         """
         if "geometry" in preferences:
-            self.settings.setValue("geometry", preferences["geometry"])
+            self.set("geometry", preferences["geometry"])
 
         if "speed" in preferences:
-            self.settings.setValue("scroll_speed", preferences["speed"])
+            self.set("scroll_speed", preferences["speed"])
 
         if "auto_reload" in preferences:
-            self.settings.setValue("auto_reload", preferences["auto_reload"])
+            self.set("auto_reload", preferences["auto_reload"])
 
     # SettingsStorageProtocol implementation
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a setting value."""
-        return self.settings.value(key, default)
+        try:
+            value = self._cache[key]
+        except KeyError:
+            if self.settings.contains(key):
+                value = self.settings.value(key)
+            else:
+                value = _MISSING
+            self._cache[key] = value
+        return default if value is _MISSING else value
 
     def set(self, key: str, value: Any) -> None:
         """Store a setting value."""
+        # Skip the backend write when the known value is unchanged; the type
+        # check keeps e.g. True and 1, which QSettings stores differently,
+        # apart
+        cached = self._cache.get(key, _MISSING)
+        if type(cached) is type(value) and cached == value:
+            return
+        self._cache[key] = value
         self.settings.setValue(key, value)
 
     def remove(self, key: str) -> None:
         """Remove a setting."""
+        # QSettings.remove also drops child keys, so forget everything
+        self._cache.clear()
         self.settings.remove(key)
 
     def clear(self) -> None:
         """Clear all settings."""
+        self._cache.clear()
         self.settings.clear()
 
     def toggle_auto_reload(self) -> bool:
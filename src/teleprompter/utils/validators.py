@@ -381,6 +381,16 @@ class TeleprompterConfigValidator(ConfigValidator):
             ),
         )
 
+        # Markdown rendering
+        self.register(
+            "markdown_engine",
+            lambda v: Validators.validate_choice(
+                v,
+                ["python-markdown", "markdown-it", "cmarkgfm"],
+                field_name="markdown_engine",
+            ),
+        )
+
         # File paths
         self.register(
             "last_file", lambda v: Validators.validate_file_path(v, must_exist=False)
@@ -36,7 +36,7 @@ def container():
     mock_style_provider = Mock(spec=StyleProviderProtocol)
 
     # Configure default mock behaviors
-    mock_file_loader.get_supported_extensions.return_value = [".md", ".txt"]
+    mock_file_loader.get_supported_extensions.return_value = (".md", ".txt")
     mock_content_parser.parse.return_value = "<p>Test content</p>"
     mock_content_parser.get_word_count.return_value = 100
     mock_settings.get.return_value = None
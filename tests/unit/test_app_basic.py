@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+
 from src.teleprompter.core.container import ServiceContainer, configure_container
 from src.teleprompter.core.protocols import (
     ContentParserProtocol,
@@ -108,6 +110,58 @@ class TestApplicationBasics:
             value = manager.get("test_key", "default_value")
             assert value is not None
 
+    def test_settings_manager_caches_reads(self):
+        """Test SettingsManager serves repeated reads from its cache."""
+        from teleprompter.utils.settings_manager import SettingsManager
+
+        with patch("teleprompter.utils.settings_manager.QSettings") as qsettings:
+            backend = qsettings.return_value
+            backend.contains.side_effect = lambda key: key == "scroll_speed"
+            backend.value.return_value = 2.5
+            manager = SettingsManager()
+
+            assert manager.get("scroll_speed") == 2.5
+            assert manager.get("scroll_speed") == 2.5
+            assert backend.value.call_count == 1
+
+            # Absent keys are remembered too, but still honour the default
+            assert manager.get("missing", "fallback") == "fallback"
+            assert manager.get("missing") is None
+            assert backend.contains.call_count == 2
+
+            # Writes go through to the backend and refresh the cache
+            manager.set("scroll_speed", 3.0)
+            backend.setValue.assert_called_with("scroll_speed", 3.0)
+            assert manager.get("scroll_speed") == 3.0
+            assert backend.value.call_count == 1
+
+            manager.clear()
+            assert manager.get("scroll_speed") == 2.5
+            assert backend.value.call_count == 2
+
+    def test_settings_manager_skips_unchanged_writes(self):
+        """Test SettingsManager only writes values that changed."""
+        from teleprompter.utils.settings_manager import SettingsManager
+
+        with patch("teleprompter.utils.settings_manager.QSettings") as qsettings:
+            backend = qsettings.return_value
+            backend.contains.return_value = True
+            backend.value.return_value = 1.0
+            manager = SettingsManager()
+
+            manager.save_preferences({"speed": 1.5})
+            manager.save_preferences({"speed": 1.5})
+            assert backend.setValue.call_count == 1
+
+            # A value read from the backend counts as known
+            assert manager.get("auto_reload") == 1.0
+            manager.set("auto_reload", 1.0)
+            assert backend.setValue.call_count == 1
+
+            # Equal but differently typed values are still written
+            manager.set("auto_reload", True)
+            assert backend.setValue.call_count == 2
+
     def test_style_manager_unit(self):
         """Test StyleManager in isolation."""
         from src.teleprompter.ui.managers.style_manager import StyleManager
@@ -174,3 +228,51 @@ class TestApplicationBasics:
             "Error with context", context={"key": "value"}
         )
         assert error_with_context.context == {"key": "value"}
+
+    def test_file_reloaded_ignores_other_file(self):
+        """Test a reload result for a file that is no longer open is dropped."""
+        pytest.importorskip("PyQt6.QtWebEngineWidgets")
+        from src.teleprompter.ui.app import TeleprompterApp
+
+        app = Mock()
+        app.file_manager.get_current_file_path.return_value = "/current.md"
+
+        TeleprompterApp._on_file_reloaded(app, "<p>Old</p>", "/previous.md", "Old")
+        app.teleprompter.reload_content_with_state.assert_not_called()
+
+        TeleprompterApp._on_file_reloaded(app, "<p>New</p>", "/current.md", "New")
+        app.teleprompter.reload_content_with_state.assert_called_once_with("<p>New</p>")
+
+    def test_file_reload_requested_skips_unchanged_file(self, tmp_path):
+        """Test a change event for an unmodified file doesn't reload it."""
+        pytest.importorskip("PyQt6.QtWebEngineWidgets")
+        from PyQt6.QtCore import QThreadPool
+        from PyQt6.QtWidgets import QApplication
+
+        from src.teleprompter.domain.content.file_manager import FileManager
+        from src.teleprompter.ui.app import TeleprompterApp
+
+        qapp = QApplication.instance() or QApplication([])
+        parser = Mock()
+        parser.parse_content.return_value = "<p>Script</p>"
+        script = tmp_path / "script.md"
+        script.write_text("Script")
+
+        app = Mock()
+        app.settings_manager.get.return_value = True
+        app.file_manager = FileManager(parser)
+        app.file_manager._load_file_async(str(script))
+        QThreadPool.globalInstance().waitForDone()
+        qapp.processEvents()
+
+        reloaded = []
+        app.file_manager.file_reloaded.connect(lambda *args: reloaded.append(args))
+        try:
+            TeleprompterApp._on_file_reload_requested(app, str(script))
+            QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+            assert reloaded == []
+            assert parser.parse_content.call_count == 1
+        finally:
+            app.file_manager.stop_watching()
@@ -50,6 +50,35 @@ class TestContentManager:
         mock_parser.parse.assert_called_once_with(content)
         mock_parser.get_word_count.assert_called_once_with(content)
 
+    def test_load_content_reuses_cache(self, manager, mock_parser):
+        """Test reloading identical content skips re-parsing."""
+        content = "# Title\n\nBody text."
+        manager.load_content(content)
+        manager.load_content("Other content")
+        manager.load_content(content)
+
+        assert mock_parser.parse.call_count == 2
+        assert manager._current_content == content
+        assert manager._sections == [(0, "Title")]
+
+    def test_load_content_unchanged_skips_processing(self, manager, mock_parser):
+        """Test loading identical content again is a no-op."""
+        content = "# Title\n\nBody text."
+        manager.load_content(content)
+        manager.load_content(content)
+
+        mock_parser.parse.assert_called_once_with(content)
+
+    def test_load_content_shifts_sections_on_body_edit(self, manager):
+        """Test a body-only edit shifts sections without re-extracting."""
+        manager.load_content("# One\nText.\n# Two\nMore.")
+        manager._extract_sections = Mock()
+
+        manager.load_content("# One\nText.\nAdded line.\n# Two\nMore.")
+
+        manager._extract_sections.assert_not_called()
+        assert manager._sections == [(0, "One"), (3, "Two")]
+
     def test_get_parsed_content(self, manager):
         """Test getting parsed HTML content."""
         manager._parsed_content = "<p>Test HTML</p>"
@@ -64,10 +93,10 @@ class TestContentManager:
         """Test getting sections."""
         manager._sections = [(0, "Section 1"), (10, "Section 2")]
         sections = manager.get_sections()
-        assert sections == [(0, "Section 1"), (10, "Section 2")]
-        # Ensure it returns a copy
-        sections.append((20, "Section 3"))
-        assert len(manager._sections) == 2
+        assert sections == ((0, "Section 1"), (10, "Section 2"))
+        # Ensure it returns a read-only view that is reused between calls
+        assert isinstance(sections, tuple)
+        assert manager.get_sections() is sections
 
     def test_extract_sections(self, manager):
         """Test section extraction from markdown."""
@@ -92,6 +121,13 @@ Final text."""
         assert manager._sections[2] == (6, "Subsection 1.1")
         assert manager._sections[3] == (9, "Section 2")
 
+    def test_extract_sections_ignores_non_headers(self, manager):
+        """Test extraction skips hashtags and handles CRLF line endings."""
+        manager._current_content = "#hashtag text\r\n\r\n## Real Header  \r\nBody"
+        manager._extract_sections()
+
+        assert manager._sections == [(2, "Real Header")]
+
     def test_find_section_at_progress(self, manager):
         """Test finding section at reading progress."""
         # Setup sections
@@ -130,12 +166,15 @@ Final text."""
         """Test getting detailed section information."""
         # Setup
         content = "# Section 1\nWord one two.\n\n# Section 2\nWord three four five."
-        manager._current_content = content
-        manager._sections = [(0, "Section 1"), (3, "Section 2")]
 
         # Mock parser to return different word counts
         mock_parser.get_word_count.side_effect = [3, 3]  # 3 words per section
 
+        # Section stats are prepared during extraction
+        manager._current_content = content
+        manager._extract_sections()
+        assert manager._sections == [(0, "Section 1"), (3, "Section 2")]
+
         # Test first section
         info = manager.get_section_info(0)
         assert info["index"] == 0
@@ -176,7 +215,7 @@ Final text."""
         """Test behavior with empty content."""
         # Initial state should be empty
         assert manager.get_word_count() == 0
-        assert manager.get_sections() == []
+        assert manager.get_sections() == ()
         assert manager.get_parsed_content() == ""
 
         summary = manager.get_content_summary()
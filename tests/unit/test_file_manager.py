@@ -3,9 +3,10 @@
 import os
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
+from PyQt6.QtCore import QThreadPool
 from PyQt6.QtWidgets import QApplication
 
 from src.teleprompter.domain.content.file_manager import FileManager
@@ -121,6 +122,18 @@ class TestFileManager:
         finally:
             tmp_path.unlink()
 
+    def test_load_file_normalizes_newlines(self, manager):
+        """Test CRLF and CR line endings are normalized like text mode."""
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".md", delete=False) as tmp:
+            tmp.write(b"# Title\r\n\r\nLine one\rLine two")
+            tmp_path = Path(tmp.name)
+
+        try:
+            content = manager.load_file(str(tmp_path))
+            assert content == "# Title\n\nLine one\nLine two"
+        finally:
+            tmp_path.unlink()
+
     def test_save_file_creates_parent_dirs(self, manager):
         """Test saving file creates parent directories."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -152,6 +165,65 @@ class TestFileManager:
             tmp_path.chmod(0o644)
             tmp_path.unlink()
 
+    def test_load_file_permission_denied_message(self, manager):
+        """Test a permission failure keeps the standard message format."""
+        denied = PermissionError(13, "Permission denied")
+        with (
+            patch("os.open", side_effect=denied),
+            pytest.raises(PermissionError) as exc_info,
+        ):
+            manager.load_file("/scripts/locked.md")
+
+        assert str(exc_info.value) == (
+            "[Errno 13] Permission denied: '/scripts/locked.md'"
+        )
+
+    def test_load_file_is_a_directory(self, manager):
+        """Test opening a directory reports an unsupported format."""
+        is_dir = IsADirectoryError(21, "Is a directory")
+        with (
+            patch("os.open", side_effect=is_dir),
+            pytest.raises(ValueError, match="Unsupported file format"),
+        ):
+            manager.load_file("/scripts/folder.md")
+
+    def test_load_file_async_directory_error_type(self, manager, qapp):
+        """Test a directory named like a script is a file format error."""
+        with (
+            tempfile.TemporaryDirectory(suffix=".md") as dir_path,
+            patch.object(manager, "_emit_error") as emit_error,
+        ):
+            manager._load_file_async(dir_path)
+            QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+        emit_error.assert_called_once_with(
+            "Unsupported file format: .md", "File Format Error"
+        )
+
+    def test_load_file_async_permission_error_type(self, manager, qapp):
+        """Test a permission failure is reported with the loading error."""
+        with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as tmp:
+            tmp_path = Path(tmp.name)
+
+        denied = PermissionError(13, "Permission denied")
+        try:
+            with (
+                patch("os.open", side_effect=denied),
+                patch.object(manager, "_emit_error") as emit_error,
+            ):
+                manager._load_file_async(str(tmp_path))
+                QThreadPool.globalInstance().waitForDone()
+                qapp.processEvents()
+        finally:
+            tmp_path.unlink()
+
+        emit_error.assert_called_once_with(
+            f"Unexpected error loading file: [Errno 13] Permission denied: "
+            f"'{tmp_path}'",
+            "Loading Error",
+        )
+
     def test_save_file_success(self, manager):
         """Test successful file saving."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tmp:
@@ -167,6 +239,152 @@ class TestFileManager:
         finally:
             tmp_path.unlink()
 
+    def test_load_file_async_uses_parse_cache(self, manager, parser, qapp):
+        """Test reloading an unchanged file reuses the cached parse."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tmp:
+            tmp.write("# Cached\n\nContent.")
+            tmp_path = Path(tmp.name)
+
+        loaded = []
+        manager.file_loaded.connect(lambda *args: loaded.append(args))
+
+        try:
+            for _ in range(2):
+                manager._load_file_async(str(tmp_path))
+                QThreadPool.globalInstance().waitForDone()
+                qapp.processEvents()
+
+            assert parser.parse_content.call_count == 1
+            assert len(loaded) == 2
+            assert loaded[1][2] == "# Cached\n\nContent."
+        finally:
+            manager.stop_watching()
+            tmp_path.unlink()
+
+    def test_reload_current_file_skips_unchanged(self, manager, qapp):
+        """Test reloading is skipped when the file fingerprint is unchanged."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tmp:
+            tmp.write("# Unchanged")
+            tmp_path = Path(tmp.name)
+
+        try:
+            manager._load_file_async(str(tmp_path))
+            QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+            started = []
+            manager.loading_started.connect(lambda: started.append(True))
+            manager.reload_current_file()
+
+            assert started == []
+        finally:
+            manager.stop_watching()
+            tmp_path.unlink()
+
+    def test_reload_file_async_skips_unchanged(self, manager, parser, qapp):
+        """Test a change event for an unmodified file doesn't re-read it."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tmp:
+            tmp.write("# Unchanged")
+            tmp_path = Path(tmp.name)
+
+        reloaded = []
+        manager.file_reloaded.connect(lambda *args: reloaded.append(args))
+
+        try:
+            manager._load_file_async(str(tmp_path))
+            QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+            manager.reload_file_async(str(tmp_path))
+            assert not manager._pending_loads
+
+            # A real modification is picked up
+            tmp_path.write_text("# Changed content")
+            manager.reload_file_async(str(tmp_path))
+            QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+            assert len(reloaded) == 1
+            assert reloaded[0][2] == "# Changed content"
+        finally:
+            manager.stop_watching()
+            tmp_path.unlink()
+
+    def test_preload_files_warms_parse_cache(self, manager, parser, qapp):
+        """Test preloaded files are served from the parse cache."""
+        paths = []
+        for index in range(3):
+            with tempfile.NamedTemporaryFile(
+                mode="w", suffix=".md", delete=False
+            ) as tmp:
+                tmp.write(f"# File {index}")
+                paths.append(tmp.name)
+
+        try:
+            manager.preload_files(paths)
+            manager._preload_pool.waitForDone()
+            qapp.processEvents()
+
+            assert parser.parse_content.call_count == 3
+            assert len(manager._parse_cache) == 3
+            assert not manager._pending_loads
+        finally:
+            for path in paths:
+                os.unlink(path)
+
+    def test_reload_file_async(self, manager, parser, qapp):
+        """Test reloading delivers fresh content without a file_loaded signal."""
+        parser.parse_content.return_value = "<h1>Updated</h1>"
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tmp:
+            tmp.write("# Updated")
+            tmp_path = Path(tmp.name)
+
+        loaded = []
+        reloaded = []
+        manager.file_loaded.connect(lambda *args: loaded.append(args))
+        manager.file_reloaded.connect(lambda *args: reloaded.append(args))
+
+        try:
+            manager._current_file_path = str(tmp_path)
+            manager.reload_file_async(str(tmp_path))
+            QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+            assert reloaded == [("<h1>Updated</h1>", str(tmp_path), "# Updated")]
+            assert not loaded
+            assert not manager._pending_loads
+        finally:
+            tmp_path.unlink()
+
+    def test_reload_file_async_drops_stale_result(self, manager, parser, qapp):
+        """Test a reload finishing after another file was opened is dropped."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tmp:
+            tmp.write("# Old file")
+            tmp_path = Path(tmp.name)
+
+        reloaded = []
+        manager.file_reloaded.connect(lambda *args: reloaded.append(args))
+
+        try:
+            manager._current_file_path = "/other/file.md"
+            manager.reload_file_async(str(tmp_path))
+            QThreadPool.globalInstance().waitForDone()
+            qapp.processEvents()
+
+            assert reloaded == []
+            assert manager._last_loaded_fingerprint is None
+            assert not manager._pending_loads
+        finally:
+            tmp_path.unlink()
+
+    def test_get_empty_state_html_is_memoized(self, manager, parser):
+        """Test the empty state HTML is rendered only once."""
+        parser._generate_empty_state_html.return_value = "<p>Empty</p>"
+
+        assert manager.get_empty_state_html() == "<p>Empty</p>"
+        assert manager.get_empty_state_html() == "<p>Empty</p>"
+        parser._generate_empty_state_html.assert_called_once()
+
     def test_get_file_stats(self, manager):
         """Test getting file statistics - skipped as not implemented."""
         pass
@@ -11,6 +11,7 @@ from teleprompter.utils.logging import (
     TeleprompterLogger,
     get_logger,
     log_method_calls,
+    log_performance,
 )
 
 
@@ -178,6 +179,32 @@ class TestPerformanceLogger:
         # Trying to stop again should return 0.0
         assert perf_logger.end_timer("test_block") == 0.0
 
+    def test_context_manager_skips_disabled_levels(self):
+        """Test that filtered-out levels are never called by the timer."""
+
+        class RecordingLogger:
+            def __init__(self):
+                self.calls = []
+
+            def isEnabledFor(self, level):
+                return level >= logging.WARNING
+
+            def debug(self, *args, **kwargs):
+                self.calls.append("debug")
+
+            def info(self, *args, **kwargs):
+                self.calls.append("info")
+
+        recorder = RecordingLogger()
+        perf_logger = PerformanceLogger(recorder)
+
+        with perf_logger.timer("quiet_block"):
+            pass
+        perf_logger.start_timer("quiet_timer")
+        assert perf_logger.end_timer("quiet_timer") >= 0.0
+
+        assert recorder.calls == []
+
 
 class TestDecorators:
     """Test logging decorators."""
@@ -218,6 +245,38 @@ class TestDecorators:
             messages = [r.message for r in caplog.records]
             assert any("failing_method" in msg for msg in messages)
 
+    def test_log_performance_skips_timer_when_disabled(self):
+        """Test that log_performance does not time calls below INFO."""
+
+        class RecordingLogger:
+            def __init__(self, level):
+                self.level = level
+                self.calls = []
+
+            def isEnabledFor(self, level):
+                return level >= self.level
+
+            def debug(self, *args, **kwargs):
+                self.calls.append("debug")
+
+            def info(self, *args, **kwargs):
+                self.calls.append("info")
+
+        class TestClass:
+            @log_performance("quiet_op")
+            def run(self):
+                return "done"
+
+        obj = TestClass()
+
+        obj.logger = RecordingLogger(logging.WARNING)
+        assert obj.run() == "done"
+        assert obj.logger.calls == []
+
+        obj.logger = RecordingLogger(logging.INFO)
+        assert obj.run() == "done"
+        assert obj.logger.calls == ["info"]
+
 
 def test_get_logger():
     """Test the global get_logger function."""
@@ -1,8 +1,11 @@
 """Unit tests for markdown parser."""
 
+from pathlib import Path
+
 import pytest
 
 from teleprompter.domain.content import MarkdownParser
+from teleprompter.domain.content import parser as parser_module
 
 
 class TestMarkdownParser:
@@ -13,6 +16,12 @@ class TestMarkdownParser:
         """Create a MarkdownParser instance."""
         return MarkdownParser()
 
+    @pytest.fixture
+    def no_optional_engines(self, mocker):
+        """Make Python-Markdown the only available engine."""
+        mocker.patch("teleprompter.domain.content.parser.CMARKGFM_AVAILABLE", False)
+        mocker.patch("teleprompter.domain.content.parser.MARKDOWN_IT_AVAILABLE", False)
+
     def test_parse_basic_markdown(self, parser):
         """Test parsing basic markdown elements."""
         markdown = """# Heading 1
@@ -238,3 +247,164 @@ This is a separate paragraph."""
         # Code blocks should be excluded
         markdown = "Text before\n```\ncode block content\n```\nText after"
         assert parser.get_word_count(markdown) == 4  # "Text before Text after"
+
+    def test_parse_reuses_cached_html(self, parser, mocker):
+        """Test that unchanged markdown is only converted once."""
+        convert_spy = mocker.patch.object(
+            parser, "_render", wraps=parser._get_renderer()
+        )
+
+        first = parser.parse("# Title\n\nBody text")
+        second = parser.parse("# Title\n\nBody text")
+
+        assert first == second
+        assert convert_spy.call_count == 1
+
+        parser.parse("# Other")
+        assert convert_spy.call_count == 2
+
+    def test_html_cache_is_bounded(self, parser):
+        """Test that the HTML cache evicts the least recently used entry."""
+        for i in range(parser.HTML_CACHE_SIZE + 1):
+            parser.parse(f"Document {i}")
+
+        assert len(parser._html_cache) == parser.HTML_CACHE_SIZE
+        assert "Document 0" not in parser._html_cache
+
+    def test_static_html_is_built_once(self, parser, mocker):
+        """Test that static state pages are built once and reused."""
+        build_spy = mocker.spy(MarkdownParser, "_build_error_html_parts")
+
+        first = parser._generate_error_html("Missing file", "File Not Found")
+        second = parser._generate_error_html("Bad encoding")
+
+        assert build_spy.call_count == 1
+        assert "File Not Found" in first and "Missing file" in first
+        assert "File Error" in second and "Bad encoding" in second
+        assert parser._generate_loading_html() is parser._generate_loading_html()
+
+    def test_get_word_count_partial_syntax(self, parser):
+        """Test word counting when only some markdown markers are present."""
+        assert parser.get_word_count("Plain script line with no markup") == 6
+        assert parser.get_word_count("A [bracketed] aside and `code`") == 4
+        assert parser.get_word_count("## Heading\nwith snake_case words") == 4
+
+    def test_parse_file(self, parser, tmp_path):
+        """Test parsing a markdown file with Windows line endings."""
+        file_path = tmp_path / "script.md"
+        file_path.write_bytes(b"# Title\r\n\r\nBody text\r\n")
+
+        html = parser.parse_file(str(file_path))
+
+        assert "<h1>Title</h1>" in html
+        assert "<p>Body text</p>" in html
+        assert "\r" not in html
+
+    def test_parse_file_too_large(self, parser, tmp_path, mocker):
+        """Test that oversized files are rejected."""
+        file_path = tmp_path / "large.md"
+        file_path.write_bytes(b"x" * 11)
+        mocker.patch.object(parser, "config", {"MAX_FILE_SIZE": 10})
+
+        read_bytes = mocker.spy(Path, "read_bytes")
+
+        with pytest.raises(ValueError, match="exceeds maximum of 10 bytes"):
+            parser.parse_file(str(file_path))
+        # Rejected from the file size alone, without reading the contents
+        read_bytes.assert_not_called()
+
+    def test_python_markdown_is_default_engine(self, parser):
+        """Test the full "extra" dialect is rendered unless another engine is set."""
+        assert parser._get_renderer() == parser._render_with_python_markdown
+
+        html = parser.parse(
+            "Text[^1] about HTML.\n\n[^1]: A note.\n\n"
+            "*[HTML]: Hyper Text Markup Language\n\n"
+            "Term\n:   Definition\n\n"
+            "## Cue {: .cue }"
+        )
+        assert 'class="footnote"' in html
+        assert "<abbr" in html
+        assert "<dl>" in html
+        assert 'class="cue"' in html
+
+    def test_falls_back_to_python_markdown(self, no_optional_engines, mocker):
+        """Test rendering with Python-Markdown when the set engine is missing."""
+        parser = MarkdownParser()
+        mocker.patch.object(parser, "config", {"markdown_engine": "cmarkgfm"})
+
+        assert parser._get_renderer() == parser._render_with_python_markdown
+        html = parser.parse("# Title\n\n| A | B |\n|---|---|\n| 1 | 2 |")
+        assert "<h1>Title</h1>" in html
+        assert "<table>" in html
+
+    def test_get_word_count_reuses_last_result(self, parser, mocker):
+        """Test that re-counting unchanged content skips the regex passes."""
+        header_re = mocker.patch(
+            "teleprompter.domain.content.parser._HEADER_MARKER_RE",
+            wraps=parser_module._HEADER_MARKER_RE,
+        )
+
+        assert parser.get_word_count("# Title\n\nSome words") == 3
+        assert parser.get_word_count("# Title\n\nSome words") == 3
+        assert header_re.sub.call_count == 1
+
+        assert parser.get_word_count("# Other title") == 2
+        assert header_re.sub.call_count == 2
+
+    def test_python_markdown_state_does_not_leak(self, no_optional_engines):
+        """Test that reference definitions don't carry over between documents."""
+        parser = MarkdownParser()
+
+        parser.parse("See [docs][ref].\n\n[ref]: https://example.com")
+        html = parser.parse("Dangling [docs][ref].")
+
+        assert "https://example.com" not in html
+
+    def test_markdown_engine_created_on_first_parse(self, parser):
+        """Test that no markdown engine is built until something is parsed."""
+        assert parser._render is None
+
+        parser._generate_empty_state_html()
+        assert parser._render is None
+
+        parser.parse("# Title")
+        assert parser._render is not None
+
+    @pytest.mark.parametrize(
+        ("engine", "module", "flag"),
+        [
+            ("cmarkgfm", "cmarkgfm", "CMARKGFM_AVAILABLE"),
+            ("markdown-it", "markdown_it", "MARKDOWN_IT_AVAILABLE"),
+        ],
+    )
+    def test_optional_engines_render_supported_syntax(
+        self, engine, module, flag, no_optional_engines, mocker
+    ):
+        """Test that each optional engine renders the syntax Python-Markdown does."""
+        pytest.importorskip(module)
+        mocker.patch(f"teleprompter.domain.content.parser.{flag}", True)
+        parser = MarkdownParser()
+        mocker.patch.object(parser, "config", {"markdown_engine": engine})
+
+        html = parser.parse(
+            "# Title\n\nLine one\nLine two\n\n| A | B |\n|---|---|\n| 1 | 2 |\n\n"
+            '<span class="note">raw</span>'
+        )
+
+        assert "<h1>Title</h1>" in html
+        assert "Line one<br" in html
+        assert "<table>" in html
+        assert '<span class="note">raw</span>' in html
+
+    def test_markdown_it_footnotes_and_deflists(self, mocker):
+        """Test markdown-it renders footnotes and definition lists via plugins."""
+        pytest.importorskip("markdown_it")
+        pytest.importorskip("mdit_py_plugins")
+        parser = MarkdownParser()
+        mocker.patch.object(parser, "config", {"markdown_engine": "markdown-it"})
+
+        html = parser.parse("Text[^1]\n\n[^1]: A note.\n\nTerm\n:   Definition")
+
+        assert "footnote" in html
+        assert "<dl>" in html
@@ -62,7 +62,7 @@ class TestReadingMetricsService:
         assert service.calculate_words_per_minute(2.0) == 300.0
         assert service.calculate_words_per_minute(0.5) == 75.0
 
-    @patch("teleprompter.domain.reading.metrics.time.time")
+    @patch("teleprompter.domain.reading.metrics.time.monotonic")
     def test_reading_session_timing(self, mock_time, service):
         """Test reading session timing functionality."""
         # Start reading at time 100
@@ -93,7 +93,7 @@ class TestReadingMetricsService:
         """Test elapsed time when session hasn't started."""
         assert service.get_elapsed_time() == 0.0
 
-    @patch("teleprompter.domain.reading.metrics.time.time")
+    @patch("teleprompter.domain.reading.metrics.time.monotonic")
     def test_get_remaining_time(self, mock_time, service):
         """Test remaining time calculation."""
         # Set up reading session
@@ -132,12 +132,14 @@ class TestReadingMetricsService:
         service._current_progress = 0.5
 
         # Override get_elapsed_time to return a fixed value
-        with patch.object(service, "get_elapsed_time", return_value=60.0):
+        with patch.object(ReadingMetricsService, "get_elapsed_time", return_value=60.0):
             assert service.get_average_wpm() == 150.0
 
         # Test with 100% progress
         service._current_progress = 1.0
-        with patch.object(service, "get_elapsed_time", return_value=120.0):
+        with patch.object(
+            ReadingMetricsService, "get_elapsed_time", return_value=120.0
+        ):
             assert service.get_average_wpm() == 150.0
 
     def test_format_time(self, service):
@@ -149,6 +151,11 @@ class TestReadingMetricsService:
         assert service.format_time(3665) == "1h 1m"
         assert service.format_time(7200) == "2h 0m"
 
+        # Fractional seconds are truncated, never rounded up
+        assert service.format_time(59.9) == "59s"
+        assert service.format_time(119.9) == "1m 59s"
+        assert service.format_time(3599.5) == "59m 59s"
+
     def test_get_statistics(self, service):
         """Test comprehensive statistics generation."""
         service.set_word_count(300)
@@ -159,11 +166,7 @@ class TestReadingMetricsService:
         service._pause_time = None
         service._total_pause_duration = 0.0
 
-        # Mock get_elapsed_time and get_average_wpm
-        with (
-            patch.object(service, "get_elapsed_time", return_value=60.0),
-            patch.object(service, "get_average_wpm", return_value=150.0),
-        ):
+        with patch.object(ReadingMetricsService, "get_elapsed_time", return_value=60.0):
             stats = service.get_statistics()
 
         assert stats["total_words"] == 300
@@ -172,10 +175,27 @@ class TestReadingMetricsService:
         assert stats["progress_percentage"] == 50.0
         assert stats["elapsed_time"] == 60.0
         assert stats["elapsed_time_formatted"] == "1m"
-        assert stats["average_wpm"] == 150.0
+        # 150 words in 60 seconds, with 150 left at the same pace
+        assert stats["average_wpm"] == service._average_wpm_for(60.0) == 150.0
+        assert stats["remaining_time"] == service._remaining_time_for(60.0) == 60.0
         assert stats["is_paused"] is False
         assert stats["total_pause_duration"] == 0.0
 
+    def test_get_statistics_reads_elapsed_once(self, service):
+        """Test statistics derive every value from a single elapsed time."""
+        service.set_word_count(300)
+        service.set_progress(0.5)
+
+        with patch.object(
+            ReadingMetricsService, "get_elapsed_time", return_value=60.0
+        ) as mock_elapsed:
+            stats = service.get_statistics()
+
+        assert mock_elapsed.call_count == 1
+        assert stats["remaining_time"] == 60.0
+        assert stats["remaining_time_formatted"] == "1m"
+        assert stats["average_wpm"] == 150.0
+
     def test_stop_reading(self, service):
         """Test stopping a reading session."""
         service._start_time = 100.0
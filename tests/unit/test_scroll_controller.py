@@ -1,5 +1,6 @@
 """Unit tests for scroll controller."""
 
+import numpy as np
 import pytest
 
 from src.teleprompter.domain.reading.controller import ScrollController
@@ -16,8 +17,8 @@ class TestScrollController:
     def test_initialization(self, controller):
         """Test controller initialization."""
         assert controller._speed == 1.0
-        assert controller._is_scrolling is False
-        assert controller._is_paused is False
+        assert controller.is_active() is False
+        assert controller.is_scrolling() is False
         assert controller._progress == 0.0
         assert controller._scroll_position == 0
         assert controller._viewport_height == 0
@@ -48,6 +49,41 @@ class TestScrollController:
         assert controller._scroll_position == 75
         assert controller._progress == 0.75  # 75/100 (max_scroll)
 
+    def test_update_scroll_position_unchanged(self, controller):
+        """Test progress is only recomputed when position or range changes."""
+        controller.set_viewport_dimensions(100, 200)
+        controller.update_scroll_position(50)
+        assert controller.get_progress() == 0.5
+
+        # Same position and range leaves progress alone
+        controller._progress = 0.25
+        controller.update_scroll_position(50)
+        assert controller.get_progress() == 0.25
+
+        # Same position against a new range recomputes it
+        controller.set_viewport_dimensions(100, 600)
+        controller.update_scroll_position(50)
+        assert controller.get_progress() == 0.1
+        controller.set_viewport_dimensions(100, 150)
+        controller.update_scroll_position(50)
+        assert controller.get_progress() == 1.0
+
+        # Negative positions clamp to the top
+        controller.update_scroll_position(-10)
+        assert controller._scroll_position == 0
+        assert controller.get_progress() == 0.0
+
+    def test_set_position_then_update_refreshes_progress(self, controller):
+        """Test an external position write doesn't leave progress stale."""
+        controller.set_viewport_dimensions(100, 1100)
+        controller.update_scroll_position(100)
+        assert controller.get_progress() == 0.1
+
+        # A jump followed by the scroll event for the same position
+        controller.set_position(900)
+        controller.update_scroll_position(900)
+        assert controller.get_progress() == 0.9
+
     def test_set_viewport_dimensions(self, controller):
         """Test setting viewport dimensions."""
         controller.set_viewport_dimensions(600, 1200)
@@ -87,16 +123,16 @@ class TestScrollController:
         controller._scroll_position = 50
         controller._progress = 0.5
         controller._speed = 2.0
-        controller._is_scrolling = True
-        controller._is_paused = True
+        controller.start_scrolling()
+        controller.pause_scrolling()
 
         # Stop scrolling
         controller.stop_scrolling()
 
         assert controller._scroll_position == 0
         assert controller._progress == 0.0
-        assert controller._is_scrolling is False
-        assert controller._is_paused is False
+        assert controller.is_active() is False
+        assert controller.get_state()["is_paused"] is False
         # Speed is not reset by stop_scrolling
         assert controller._speed == 2.0
 
@@ -171,6 +207,55 @@ class TestScrollController:
         next_pos = controller.calculate_next_position(0.1)
         assert next_pos == 200  # Clamped to max
 
+    def test_set_viewport_dimensions_unchanged_is_noop(self, controller, mocker):
+        """Test that re-applying the same dimensions doesn't log again."""
+        log_debug = mocker.patch.object(ScrollController, "log_debug")
+
+        controller.set_viewport_dimensions(600, 1200)
+        controller.set_viewport_dimensions(600, 1200)
+        assert log_debug.call_count == 1
+
+        controller.set_viewport_dimensions(600, 1500)
+        assert log_debug.call_count == 2
+
+    def test_calculate_next_position_tracks_changes(self, controller):
+        """Test that speed and dimension changes apply to the next frame."""
+        controller.set_viewport_dimensions(100, 300)
+        controller.start_scrolling()
+
+        controller.set_speed(3.0)
+        assert controller.calculate_next_position(0.1) == 30
+
+        # Shrinking content lowers the clamp limit
+        controller.set_viewport_dimensions(100, 120)
+        assert controller.calculate_next_position(1.0) == 20
+
+        # Content that fits the viewport never scrolls
+        controller.set_viewport_dimensions(300, 200)
+        assert controller.calculate_next_position(1.0) == 0
+
+    def test_calculate_positions(self, controller):
+        """Test calculating several future positions in one call."""
+        controller.set_viewport_dimensions(100, 300)
+        controller._scroll_position = 50
+
+        # Not scrolling - every frame stays at the current position
+        positions = controller.calculate_positions(np.full(3, 0.1))
+        assert positions.tolist() == [50, 50, 50]
+
+        controller.start_scrolling()
+        controller.set_speed(1.0)
+
+        # 10 pixels per 0.1s step, matching calculate_next_position
+        positions = controller.calculate_positions(np.full(4, 0.1))
+        assert positions.tolist() == [60, 70, 80, 90]
+        assert positions[0] == controller.calculate_next_position(0.1)
+
+        # Clamped to max scroll (200) and state left untouched
+        positions = controller.calculate_positions([1.0, 1.0])
+        assert positions.tolist() == [150, 200]
+        assert controller._scroll_position == 50
+
     def test_has_reached_end(self, controller):
         """Test checking if reached end of content."""
         controller.set_viewport_dimensions(100, 200)
@@ -213,19 +298,19 @@ class TestScrollController:
         """Test pause/resume edge cases."""
         # Pausing when not scrolling does nothing
         controller.pause_scrolling()
-        assert controller._is_paused is False
+        assert controller.is_active() is False
 
         # Start scrolling then pause
         controller.start_scrolling()
         controller.pause_scrolling()
-        assert controller._is_paused is True
+        assert controller.get_state()["is_paused"] is True
         assert controller.is_scrolling() is False
         assert controller.is_active() is True
 
         # Resume when not paused does nothing
         controller.stop_scrolling()
         controller.resume_scrolling()
-        assert controller._is_scrolling is False
+        assert controller.is_active() is False
 
     def test_get_state(self, controller):
         """Test getting controller state."""
@@ -244,3 +329,11 @@ class TestScrollController:
         assert state["is_paused"] is False
         assert state["progress"] == 0.5
         assert state["has_reached_end"] is False
+
+        # Each call returns an independent snapshot
+        state["speed"] = 99.0
+        controller.update_scroll_position(100)
+        new_state = controller.get_state()
+        assert new_state["speed"] == 1.5
+        assert new_state["has_reached_end"] is True
+        assert state["scroll_position"] == 50
@@ -40,6 +40,7 @@ class TestStyleManager:
             "voice_button_active",
             "voice_button_error",
             "voice_button_loading",
+            "voice_button_states",
             "progress_bar",
             "main_window_background",
             "web_view_background",
@@ -89,6 +90,23 @@ class TestStyleManager:
         assert "voiceButton" in listening
         assert "#0078d4" in listening  # Blue for listening
 
+        # All states in one sheet, selected by the voiceState property
+        states = manager.get_voice_button_states_stylesheet()
+        for state in ("disabled", "loading", "listening", "speaking", "error"):
+            assert f'[voiceState="{state}"]' in states
+
+    @pytest.mark.parametrize(
+        "state", ["disabled", "loading", "listening", "speaking", "error"]
+    )
+    def test_voice_button_state_sheets_match(self, manager, state):
+        """Test each per-state sheet uses the colours of its [voiceState] block."""
+        legacy = getattr(manager, f"get_voice_button_{state}_stylesheet")()
+        combined = manager.get_voice_button_states_stylesheet()
+
+        selector = f'QPushButton#voiceButton[voiceState="{state}"]'
+        state_block = combined[combined.index(selector) :].split("\n\n")[0]
+        assert state_block.replace(selector, "QPushButton#voiceButton") in legacy
+
     def test_get_theme_variables(self, manager):
         """Test getting theme variables."""
         variables = manager.get_theme_variables()
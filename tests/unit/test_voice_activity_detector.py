@@ -2,6 +2,7 @@
 
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from src.teleprompter.domain.voice.detector import VoiceActivityDetector
@@ -132,6 +133,35 @@ class TestVoiceActivityDetector:
         detector._is_speaking = False
         assert detector._is_speaking is False
 
+    def test_audio_ring_buffer(self, detector):
+        """Test buffered audio comes out in order across the wraparound."""
+        detector.BUFFER_WAIT_TIMEOUT = 0
+        samples = np.arange(detector.frame_size * 40, dtype=np.float32)
+        block = detector.frame_size // 2 + 7
+
+        frames = []
+        for start in range(0, len(samples), block):
+            chunk = samples[start : start + block]
+            detector._audio_callback(chunk[:, None], len(chunk), None, None)
+            while detector._read_frame():
+                frames.append(detector._frame_buffer.copy())
+
+        output = np.concatenate(frames)
+        np.testing.assert_array_equal(output, samples[: len(output)])
+        assert len(output) + detector._ring_count == len(samples)
+        assert detector._read_frame() is False
+
+    def test_audio_ring_buffer_overflow(self, detector):
+        """Test the oldest audio is dropped when processing falls behind."""
+        detector.BUFFER_WAIT_TIMEOUT = 0
+        capacity = len(detector._ring)
+        samples = np.arange(capacity + detector.frame_size, dtype=np.float32)
+        detector._audio_callback(samples[:, None], len(samples), None, None)
+
+        assert detector._ring_count == capacity
+        assert detector._read_frame() is True
+        assert detector._frame_buffer[0] == samples[-capacity]
+
     def test_signal_emission_queue(self, detector):
         """Test signal emission queue for thread safety."""
         # Add some pending signals
@@ -144,6 +174,26 @@ class TestVoiceActivityDetector:
         # Process signals (normally done in main thread)
         # This would emit the signals in the main thread
 
+    def test_get_audio_devices_cached(self, detector):
+        """Test the device list is reused until invalidated."""
+        devices = [
+            {"name": "Mic", "max_input_channels": 1, "default_samplerate": 16000},
+            {"name": "Speaker", "max_input_channels": 0, "default_samplerate": 48000},
+        ]
+        with patch(
+            "src.teleprompter.domain.voice.detector.sd.query_devices",
+            return_value=devices,
+        ) as mock_query:
+            first = detector.get_audio_devices()
+            second = detector.get_audio_devices()
+            assert mock_query.call_count == 1
+            assert first == second
+            assert [device["name"] for device in first] == ["Mic"]
+
+            detector.invalidate_device_cache()
+            detector.get_audio_devices()
+            assert mock_query.call_count == 2
+
     def test_set_device(self, detector):
         """Test setting audio device - if method exists."""
         if hasattr(detector, "set_device"):